@@ -1,9 +1,12 @@
 import argparse
 import asyncio
-import json
 import logging
+import sys
 
-from aioconsole import ainput
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    import json as orjson  # type: ignore[no-redef]
 
 from gree_versati.device import Device
 from gree_versati.deviceinfo import DeviceInfo
@@ -16,25 +19,31 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class DiscoveryListener(Listener):
-    device: Device
+    devices: list[Device]
 
     def __init__(self, bind):
         """Initialize the event handler."""
         super().__init__()
         self.bind = bind
+        self.devices = []
 
     """Class to handle incoming device discovery events."""
 
     async def device_found(self, device_info: DeviceInfo) -> None:
-        """A new device was found on the network."""
+        """A new device was found on the network.
+
+        Discovery runs this in its own task for every responding device, so
+        binding several devices overlaps instead of queueing behind each other.
+        """
         if self.bind:
-            self.device = Device(device_info)
-            await self.device.bind()
-            await self.device.request_version()
-            _LOGGER.info(f"Device firmware: {self.device.hid}")
+            device = Device(device_info)
+            await device.bind()
+            await device.request_version()
+            self.devices.append(device)
+            _LOGGER.info("Device firmware: %s", device.hid)
 
     def get_device(self):
-        return self.device
+        return self.devices[0] if self.devices else None
 
 
 async def run_discovery(bind=False):
@@ -58,6 +67,19 @@ async def wait_for_input():
     _LOGGER.info("Done discovering devices")
 
     device = listener.get_device()
+    if device is None or device.device_cipher is None:
+        _LOGGER.error("No bound device found, nothing to decrypt with")
+        return
+    # The cipher is fixed once bound, a key change only updates its state
+    decrypt = device.device_cipher.decrypt
+
+    # Read stdin through the event loop, so pasted dumps are consumed line by
+    # line from one buffer instead of a thread round-trip per line
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+    )
 
     while True:
         """Get text input from the command line and pass it to device's decrypt method.
@@ -66,15 +88,20 @@ async def wait_for_input():
         not much effort was put into this. This is enough to capture the pack
         and decrypt it to find correct property names and values.
         """
+        print("Enter text to decrypt: ", end="", flush=True)
+        line = await reader.readline()
+        if not line:
+            break
+
         try:
-            text = await ainput("Enter text to decrypt: ")
-            clean_text = text[text.find("{") :] if "{" in text else ""
-            obj = json.loads(clean_text)
+            start = line.find(b"{")
+            clean_text = line[start:] if start != -1 else b""
+            obj = orjson.loads(clean_text)
 
             if obj.get("pack"):
-                obj["pack"] = device._cipher.decrypt(obj["pack"])
-                _LOGGER.info(f"Decrypted pack: {obj}")
-        except json.JSONDecodeError as e:
+                obj["pack"] = decrypt(obj["pack"])
+                _LOGGER.info("Decrypted pack: %s", obj)
+        except orjson.JSONDecodeError as e:
             print(f"Invalid JSON input after cleaning: {e}")
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
@@ -10,6 +10,8 @@ import logging
 from gree_versati.device import Device
 from gree_versati.discovery import Discovery, Listener
 from gree_versati.exceptions import DeviceNotBoundError, DeviceTimeoutError
+from gree_versati.network import DeviceTransportHub
+from gree_versati.taskable import use_uvloop
 
 __version__ = "1.0.12"
 
@@ -20,6 +22,8 @@ __all__ = [
     "Listener",
     "DeviceNotBoundError",
     "DeviceTimeoutError",
+    "DeviceTransportHub",
+    "use_uvloop",
 ]
 
 logging.basicConfig(
@@ -1,11 +1,26 @@
 import asyncio
 import enum
-import re
-from typing import Any, Dict, Optional
-
-from gree_versati.base_device import BaseDevice
+import logging
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterator,
+    Mapping,
+    Optional,
+    Self,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from gree_versati.base_device import HID_VERSION_RE, BaseDevice
 from gree_versati.exceptions import DeviceNotBoundError, DeviceTimeoutError
 
+_T = TypeVar("_T")
+
 
 class AwhpProps(enum.Enum):
     T_WATER_IN_PE_W = "AllInWatTemHi"  # Whole number - 100 = temp in celsius
@@ -59,302 +74,243 @@ class AwhpProps(enum.Enum):
     EVU = "EVU"  # 0
 
 
-class AwhpDevice(BaseDevice):
-    """Device class for Air-Water Heat Pump."""
-
-    def _get_celsius(self, whole, decimal) -> Optional[float]:
-        """Helper to combine temperature values into celsius."""
-        if whole is None or decimal is None:
-            return None
-        return whole - 100 + (decimal / 10)
-
-    def t_water_in_pe(
-        self, raw_data: Optional[Dict[str, Any]] = None
-    ) -> Optional[float]:
-        """Get water input temperature."""
-        if raw_data:
-            return self._get_celsius(
-                raw_data.get(AwhpProps.T_WATER_IN_PE_W.value),
-                raw_data.get(AwhpProps.T_WATER_IN_PE_D.value),
-            )
-        return self._get_celsius(
-            self.get_property(AwhpProps.T_WATER_IN_PE_W),
-            self.get_property(AwhpProps.T_WATER_IN_PE_D),
-        )
-
-    def t_water_out_pe(
-        self, raw_data: Optional[Dict[str, Any]] = None
-    ) -> Optional[float]:
-        """Get water output temperature."""
-        if raw_data:
-            return self._get_celsius(
-                raw_data.get(AwhpProps.T_WATER_OUT_PE_W.value),
-                raw_data.get(AwhpProps.T_WATER_OUT_PE_D.value),
-            )
-        return self._get_celsius(
-            self.get_property(AwhpProps.T_WATER_OUT_PE_W),
-            self.get_property(AwhpProps.T_WATER_OUT_PE_D),
-        )
-
-    def t_opt_water(self, raw_data: Optional[Dict[str, Any]] = None) -> Optional[float]:
-        """Get optimal water temperature."""
-        if raw_data:
-            return self._get_celsius(
-                raw_data.get(AwhpProps.T_OPT_WATER_W.value),
-                raw_data.get(AwhpProps.T_OPT_WATER_D.value),
-            )
-        return self._get_celsius(
-            self.get_property(AwhpProps.T_OPT_WATER_W),
-            self.get_property(AwhpProps.T_OPT_WATER_D),
-        )
-
-    def hot_water_temp(
-        self, raw_data: Optional[Dict[str, Any]] = None
-    ) -> Optional[float]:
-        """Get hot water temperature."""
-        if raw_data:
-            return self._get_celsius(
-                raw_data.get(AwhpProps.HOT_WATER_TEMP_W.value),
-                raw_data.get(AwhpProps.HOT_WATER_TEMP_D.value),
-            )
-        return self._get_celsius(
-            self.get_property(AwhpProps.HOT_WATER_TEMP_W),
-            self.get_property(AwhpProps.HOT_WATER_TEMP_D),
-        )
-
-    def remote_home_temp(
-        self, raw_data: Optional[Dict[str, Any]] = None
-    ) -> Optional[float]:
-        """Get remote home temperature."""
-        if raw_data:
-            return self._get_celsius(
-                raw_data.get(AwhpProps.REMOTE_HOME_TEMP_W.value),
-                raw_data.get(AwhpProps.REMOTE_HOME_TEMP_D.value),
-            )
-        return self._get_celsius(
-            self.get_property(AwhpProps.REMOTE_HOME_TEMP_W),
-            self.get_property(AwhpProps.REMOTE_HOME_TEMP_D),
-        )
-
-    @property
-    def cool_temp_set(self) -> Optional[int]:
-        return self.get_property(AwhpProps.COOL_TEMP_SET)
-
-    @cool_temp_set.setter
-    def cool_temp_set(self, value: int):
-        self.set_property(AwhpProps.COOL_TEMP_SET, value)
-
-    @property
-    def heat_temp_set(self) -> Optional[int]:
-        return self.get_property(AwhpProps.HEAT_TEMP_SET)
-
-    @heat_temp_set.setter
-    def heat_temp_set(self, value: int):
-        self.set_property(AwhpProps.HEAT_TEMP_SET, value)
-
-    @property
-    def hot_water_temp_set(self) -> Optional[int]:
-        return self.get_property(AwhpProps.HOT_WATER_TEMP_SET)
-
-    @hot_water_temp_set.setter
-    def hot_water_temp_set(self, value: int):
-        self.set_property(AwhpProps.HOT_WATER_TEMP_SET, value)
-
-    @property
-    def cool_and_hot_water(self) -> bool:
-        return bool(self.get_property(AwhpProps.COOL_AND_HOT_WATER))
-
-    @cool_and_hot_water.setter
-    def cool_and_hot_water(self, value: bool):
-        self.set_property(AwhpProps.COOL_AND_HOT_WATER, int(value))
-
-    @property
-    def heat_and_hot_water(self) -> bool:
-        return bool(self.get_property(AwhpProps.HEAT_AND_HOT_WATER))
+# Property keys resolved once at import, enum member access is comparatively slow
+_ALL_PROP_VALUES: Tuple[str, ...] = tuple(p.value for p in AwhpProps)
+_PROP_VALUE_SET: FrozenSet[str] = frozenset(_ALL_PROP_VALUES)
+
+
+def _split_batches(
+    props: Tuple[str, ...], batch_size: int = 23
+) -> Tuple[Tuple[str, ...], ...]:
+    """Split status columns into batches of 23 to get all properties in 2 calls."""
+    return tuple(
+        props[i: i + batch_size] for i in range(0, len(props), batch_size)
+    )
+
+
+# Status request batches, with "hid" included until the firmware is known
+_STATUS_BATCHES = _split_batches(_ALL_PROP_VALUES)
+_STATUS_BATCHES_WITH_HID = _split_batches(_ALL_PROP_VALUES + ("hid",))
+
+_K_T_WATER_IN_PE_W = AwhpProps.T_WATER_IN_PE_W.value
+_K_T_WATER_IN_PE_D = AwhpProps.T_WATER_IN_PE_D.value
+_K_T_WATER_OUT_PE_W = AwhpProps.T_WATER_OUT_PE_W.value
+_K_T_WATER_OUT_PE_D = AwhpProps.T_WATER_OUT_PE_D.value
+_K_T_OPT_WATER_W = AwhpProps.T_OPT_WATER_W.value
+_K_T_OPT_WATER_D = AwhpProps.T_OPT_WATER_D.value
+_K_HOT_WATER_TEMP_W = AwhpProps.HOT_WATER_TEMP_W.value
+_K_HOT_WATER_TEMP_D = AwhpProps.HOT_WATER_TEMP_D.value
+_K_REMOTE_HOME_TEMP_W = AwhpProps.REMOTE_HOME_TEMP_W.value
+_K_REMOTE_HOME_TEMP_D = AwhpProps.REMOTE_HOME_TEMP_D.value
+_K_MODE = AwhpProps.MODE.value
+
+# Temperature name with its whole and decimal property keys
+_TEMP_PAIRS: Tuple[Tuple[str, str, str], ...] = (
+    ("t_water_in_pe", _K_T_WATER_IN_PE_W, _K_T_WATER_IN_PE_D),
+    ("t_water_out_pe", _K_T_WATER_OUT_PE_W, _K_T_WATER_OUT_PE_D),
+    ("t_opt_water", _K_T_OPT_WATER_W, _K_T_OPT_WATER_D),
+    ("hot_water_temp", _K_HOT_WATER_TEMP_W, _K_HOT_WATER_TEMP_D),
+    ("remote_home_temp", _K_REMOTE_HOME_TEMP_W, _K_REMOTE_HOME_TEMP_D),
+)
+
+
+def _get_celsius(
+    src: Dict[str, Any], whole_key: str, decimal_key: str
+) -> Optional[float]:
+    """Combine a whole/decimal property pair from src into celsius."""
+    whole = src.get(whole_key)
+    decimal = src.get(decimal_key)
+    if whole is None or decimal is None:
+        return None
+    return whole - 100 + (decimal / 10)
 
-    @heat_and_hot_water.setter
-    def heat_and_hot_water(self, value: bool):
-        self.set_property(AwhpProps.HEAT_AND_HOT_WATER, int(value))
 
-    @property
-    def cool_home_temp_set(self) -> Optional[int]:
-        return self.get_property(AwhpProps.COOL_HOME_TEMP_SET)
+class _ReadOnlyProp(Generic[_T]):
+    """Device property reported by the unit and never written by the client.
 
-    @cool_home_temp_set.setter
-    def cool_home_temp_set(self, value: int):
-        self.set_property(AwhpProps.COOL_HOME_TEMP_SET, value)
+    Replaces the property boilerplate, the key is resolved once and reads are a
+    single dict lookup. There is no __set__, so assigning one is a type error;
+    __delete__ still makes it a data descriptor so the assignment also fails at
+    runtime instead of shadowing the property in the instance dict.
+    """
 
-    @property
-    def heat_home_temp_set(self) -> Optional[int]:
-        return self.get_property(AwhpProps.HEAT_HOME_TEMP_SET)
+    __slots__ = ("key", "__name__")
 
-    @heat_home_temp_set.setter
-    def heat_home_temp_set(self, value: int):
-        self.set_property(AwhpProps.HEAT_HOME_TEMP_SET, value)
+    def __init__(self, prop: AwhpProps):
+        self.key: str = prop.value
+        self.__name__ = self.key
 
-    @property
-    def fast_heat_water(self) -> bool:
-        return bool(self.get_property(AwhpProps.FAST_HEAT_WATER))
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.__name__ = name
 
-    @fast_heat_water.setter
-    def fast_heat_water(self, value: bool):
-        self.set_property(AwhpProps.FAST_HEAT_WATER, int(value))
+    def _convert(self, value: Any) -> _T:
+        raise NotImplementedError
 
-    @property
-    def left_home(self) -> bool:
-        return bool(self.get_property(AwhpProps.LEFT_HOME))
+    @overload
+    def __get__(self, obj: None, objtype: Optional[type] = None) -> Self: ...
 
-    @left_home.setter
-    def left_home(self, value: bool):
-        self.set_property(AwhpProps.LEFT_HOME, int(value))
+    @overload
+    def __get__(self, obj: "AwhpDevice", objtype: Optional[type] = None) -> _T: ...
 
-    @property
-    def disinfect(self) -> bool:
-        return bool(self.get_property(AwhpProps.DISINFECT))
+    def __get__(
+        self, obj: Optional["AwhpDevice"], objtype: Optional[type] = None
+    ) -> Union[Self, _T]:
+        if obj is None:
+            return self
+        return self._convert(obj._properties.get(self.key))
 
-    @disinfect.setter
-    def disinfect(self, value: bool):
-        self.set_property(AwhpProps.DISINFECT, int(value))
+    def __delete__(self, obj: "AwhpDevice") -> None:
+        raise AttributeError(f"property '{self.__name__}' is read-only")
 
-    @property
-    def power_save(self) -> bool:
-        return bool(self.get_property(AwhpProps.POWER_SAVE))
 
-    @power_save.setter
-    def power_save(self, value: bool):
-        self.set_property(AwhpProps.POWER_SAVE, int(value))
+class _ReadOnlyIntProp(_ReadOnlyProp[Optional[int]]):
+    """Read-only device property returned as-is, None until reported."""
 
-    @property
-    def versati_series(self) -> bool:
-        return bool(self.get_property(AwhpProps.VERSATI_SERIES))
+    __slots__ = ()
 
-    @versati_series.setter
-    def versati_series(self, value: bool):
-        self.set_property(AwhpProps.VERSATI_SERIES, int(value))
+    def _convert(self, value: Any) -> Optional[int]:
+        return value
 
-    @property
-    def room_home_temp_ext(self) -> bool:
-        return bool(self.get_property(AwhpProps.ROOM_HOME_TEMP_EXT))
 
-    @room_home_temp_ext.setter
-    def room_home_temp_ext(self, value: bool):
-        self.set_property(AwhpProps.ROOM_HOME_TEMP_EXT, int(value))
+class _ReadOnlyBoolProp(_ReadOnlyProp[bool]):
+    """Read-only on/off device property, read as bool."""
 
-    @property
-    def hot_water_ext(self) -> bool:
-        return bool(self.get_property(AwhpProps.HOT_WATER_EXT))
+    __slots__ = ()
 
-    @hot_water_ext.setter
-    def hot_water_ext(self, value: bool):
-        self.set_property(AwhpProps.HOT_WATER_EXT, int(value))
+    def _convert(self, value: Any) -> bool:
+        return bool(value)
 
-    @property
-    def foc_mod_swh(self) -> bool:
-        return bool(self.get_property(AwhpProps.FOC_MOD_SWH))
 
-    @foc_mod_swh.setter
-    def foc_mod_swh(self, value: bool):
-        self.set_property(AwhpProps.FOC_MOD_SWH, int(value))
+class _IntProp(_ReadOnlyIntProp):
+    """Device property stored as-is in the properties dict."""
 
-    @property
-    def emegcy(self) -> bool:
-        return bool(self.get_property(AwhpProps.EMEGCY))
+    __slots__ = ()
 
-    @emegcy.setter
-    def emegcy(self, value: bool):
-        self.set_property(AwhpProps.EMEGCY, int(value))
+    def __set__(self, obj: "AwhpDevice", value: int) -> None:
+        # One write path, so set_property overrides and its change check apply
+        obj.set_property(self.key, value)
 
-    @property
-    def hand_fro_swh(self) -> bool:
-        return bool(self.get_property(AwhpProps.HAND_FRO_SWH))
 
-    @hand_fro_swh.setter
-    def hand_fro_swh(self, value: bool):
-        self.set_property(AwhpProps.HAND_FRO_SWH, int(value))
+class _BoolProp(_ReadOnlyBoolProp):
+    """On/off device property, read as bool and sent to the device as 0/1."""
 
-    @property
-    def water_sys_exh_swh(self) -> bool:
-        return bool(self.get_property(AwhpProps.WATER_SYS_EXH_SWH))
+    __slots__ = ()
 
-    @water_sys_exh_swh.setter
-    def water_sys_exh_swh(self, value: bool):
-        self.set_property(AwhpProps.WATER_SYS_EXH_SWH, int(value))
+    def __set__(self, obj: "AwhpDevice", value: bool) -> None:
+        obj.set_property(self.key, 1 if value else 0)
 
-    @property
-    def tank_heater_status(self) -> bool:
-        return bool(self.get_property(AwhpProps.TANK_HEATER_STATUS))
 
-    @property
-    def system_defrosting_status(self) -> bool:
-        return bool(self.get_property(AwhpProps.SYSTEM_DEFROSTING_STATUS))
+class _PropertiesView(Mapping):
+    """Read-only live view of every AwhpProps value, missing ones read as None."""
 
-    @property
-    def hp_heater_1_status(self) -> bool:
-        return bool(self.get_property(AwhpProps.HP_HEATER_1_STATUS))
+    __slots__ = ("_properties",)
 
-    @property
-    def hp_heater_2_status(self) -> bool:
-        return bool(self.get_property(AwhpProps.HP_HEATER_2_STATUS))
+    def __init__(self, properties: Dict[str, Any]):
+        self._properties = properties
 
-    @property
-    def automatic_frost_protection(self) -> bool:
-        return bool(self.get_property(AwhpProps.AUTOMATIC_FROST_PROTECTION))
+    def __getitem__(self, key: str) -> Any:
+        if key not in _PROP_VALUE_SET:
+            raise KeyError(key)
+        return self._properties.get(key)
 
-    @property
-    def temp_unit(self) -> Optional[int]:
-        return self.get_property(AwhpProps.TEMP_UNIT)
+    def __iter__(self) -> Iterator[str]:
+        return iter(_ALL_PROP_VALUES)
 
-    @property
-    def temp_rec(self) -> Optional[int]:
-        return self.get_property(AwhpProps.TEMP_REC)
+    def __len__(self) -> int:
+        return len(_ALL_PROP_VALUES)
 
-    @property
-    def all_err(self) -> Optional[int]:
-        return self.get_property(AwhpProps.ALL_ERR)
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
 
-    @property
-    def temp_rec_b(self) -> Optional[int]:
-        return self.get_property(AwhpProps.TEMP_REC_B)
 
-    @property
-    def quiet(self) -> bool:
-        return bool(self.get_property(AwhpProps.QUIET))
+class AwhpDevice(BaseDevice):
+    """Device class for Air-Water Heat Pump."""
 
-    @property
-    def bord_test(self) -> bool:
-        return bool(self.get_property(AwhpProps.BORD_TEST))
+    __slots__ = ()
 
-    @property
-    def col_colet_swh(self) -> bool:
-        return bool(self.get_property(AwhpProps.COL_COLET_SWH))
+    def t_water_in_pe(
+        self, raw_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[float]:
+        """Get water input temperature."""
+        src = raw_data or self._properties
+        return _get_celsius(src, _K_T_WATER_IN_PE_W, _K_T_WATER_IN_PE_D)
 
-    @property
-    def end_temp_cot_swh(self) -> bool:
-        return bool(self.get_property(AwhpProps.END_TEMP_COT_SWH))
+    def t_water_out_pe(
+        self, raw_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[float]:
+        """Get water output temperature."""
+        src = raw_data or self._properties
+        return _get_celsius(src, _K_T_WATER_OUT_PE_W, _K_T_WATER_OUT_PE_D)
 
-    @property
-    def model_type(self) -> Optional[int]:
-        return self.get_property(AwhpProps.MODEL_TYPE)
+    def t_opt_water(self, raw_data: Optional[Dict[str, Any]] = None) -> Optional[float]:
+        """Get optimal water temperature."""
+        src = raw_data or self._properties
+        return _get_celsius(src, _K_T_OPT_WATER_W, _K_T_OPT_WATER_D)
 
-    @property
-    def evu(self) -> bool:
-        return bool(self.get_property(AwhpProps.EVU))
+    def hot_water_temp(
+        self, raw_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[float]:
+        """Get hot water temperature."""
+        src = raw_data or self._properties
+        return _get_celsius(src, _K_HOT_WATER_TEMP_W, _K_HOT_WATER_TEMP_D)
 
-    @property
-    def power(self) -> bool:
-        return bool(self.get_property(AwhpProps.POWER))
+    def remote_home_temp(
+        self, raw_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[float]:
+        """Get remote home temperature."""
+        src = raw_data or self._properties
+        return _get_celsius(src, _K_REMOTE_HOME_TEMP_W, _K_REMOTE_HOME_TEMP_D)
 
-    @power.setter
-    def power(self, value: bool):
-        self.set_property(AwhpProps.POWER, int(value))
+    def all_temperatures(
+        self, raw_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Optional[float]]:
+        """Get all temperatures in one pass, keyed by their accessor name."""
+        src = raw_data or self._properties
+        return {name: _get_celsius(src, w, d) for name, w, d in _TEMP_PAIRS}
+
+    cool_temp_set = _IntProp(AwhpProps.COOL_TEMP_SET)
+    heat_temp_set = _IntProp(AwhpProps.HEAT_TEMP_SET)
+    hot_water_temp_set = _IntProp(AwhpProps.HOT_WATER_TEMP_SET)
+    cool_and_hot_water = _BoolProp(AwhpProps.COOL_AND_HOT_WATER)
+    heat_and_hot_water = _BoolProp(AwhpProps.HEAT_AND_HOT_WATER)
+    cool_home_temp_set = _IntProp(AwhpProps.COOL_HOME_TEMP_SET)
+    heat_home_temp_set = _IntProp(AwhpProps.HEAT_HOME_TEMP_SET)
+    fast_heat_water = _BoolProp(AwhpProps.FAST_HEAT_WATER)
+    left_home = _BoolProp(AwhpProps.LEFT_HOME)
+    disinfect = _BoolProp(AwhpProps.DISINFECT)
+    power_save = _BoolProp(AwhpProps.POWER_SAVE)
+    versati_series = _BoolProp(AwhpProps.VERSATI_SERIES)
+    room_home_temp_ext = _BoolProp(AwhpProps.ROOM_HOME_TEMP_EXT)
+    hot_water_ext = _BoolProp(AwhpProps.HOT_WATER_EXT)
+    foc_mod_swh = _BoolProp(AwhpProps.FOC_MOD_SWH)
+    emegcy = _BoolProp(AwhpProps.EMEGCY)
+    hand_fro_swh = _BoolProp(AwhpProps.HAND_FRO_SWH)
+    water_sys_exh_swh = _BoolProp(AwhpProps.WATER_SYS_EXH_SWH)
+    power = _BoolProp(AwhpProps.POWER)
+
+    tank_heater_status = _ReadOnlyBoolProp(AwhpProps.TANK_HEATER_STATUS)
+    system_defrosting_status = _ReadOnlyBoolProp(AwhpProps.SYSTEM_DEFROSTING_STATUS)
+    hp_heater_1_status = _ReadOnlyBoolProp(AwhpProps.HP_HEATER_1_STATUS)
+    hp_heater_2_status = _ReadOnlyBoolProp(AwhpProps.HP_HEATER_2_STATUS)
+    automatic_frost_protection = _ReadOnlyBoolProp(AwhpProps.AUTOMATIC_FROST_PROTECTION)
+    temp_unit = _ReadOnlyIntProp(AwhpProps.TEMP_UNIT)
+    temp_rec = _ReadOnlyIntProp(AwhpProps.TEMP_REC)
+    all_err = _ReadOnlyIntProp(AwhpProps.ALL_ERR)
+    temp_rec_b = _ReadOnlyIntProp(AwhpProps.TEMP_REC_B)
+    quiet = _ReadOnlyBoolProp(AwhpProps.QUIET)
+    bord_test = _ReadOnlyBoolProp(AwhpProps.BORD_TEST)
+    col_colet_swh = _ReadOnlyBoolProp(AwhpProps.COL_COLET_SWH)
+    end_temp_cot_swh = _ReadOnlyBoolProp(AwhpProps.END_TEMP_COT_SWH)
+    model_type = _ReadOnlyIntProp(AwhpProps.MODEL_TYPE)
+    evu = _ReadOnlyBoolProp(AwhpProps.EVU)
 
     @property
     def mode(self) -> Optional[int]:
-        return self.get_property(AwhpProps.MODE)
+        return self._properties.get(_K_MODE)
 
     @mode.setter
     def mode(self, value: int):
-        self.set_property(AwhpProps.MODE, int(value))
+        self.set_property(_K_MODE, value if type(value) is int else int(value))
 
     async def update_all_properties(self) -> None:
         """Update all device properties in a single request."""
@@ -363,63 +319,55 @@ class AwhpDevice(BaseDevice):
         return None
 
     async def get_all_properties(self) -> dict:
-        """Get all properties in a single request and return them."""
+        """Get all properties in a single request and return them.
+
+        Returns a new dict, use `properties` to read without copying.
+        """
         await self.update_all_properties()
 
-        # Create a dictionary of all defined properties
-        return {
-            prop.value: self.get_property(prop)
-            for prop in AwhpProps
-        }
+        # Create a dictionary of all defined properties, missing ones map to None
+        return dict(zip(_ALL_PROP_VALUES, map(self._properties.get, _ALL_PROP_VALUES)))
+
+    @property
+    def properties(self) -> Mapping[str, Any]:
+        """Live read-only view of all properties, keyed like get_all_properties."""
+        return _PropertiesView(self._properties)
 
     async def update_state(self, wait_for: float = 30):
         """Update the internal state of the device."""
         if not self.device_cipher:
             await self.bind()
 
-        self._logger.debug(
-            "Updating AWHP device properties for (%s)", str(self.device_info)
-        )
+        self._logger.debug("Updating AWHP device properties for (%s)", self.device_info)
 
-        # Get all properties from the enum
-        all_props = [prop.value for prop in AwhpProps]
-        if not self.hid:
-            all_props.append("hid")
-
-        # Split into batches of 23 properties to get all properties in 2 calls
-        batch_size = 23
-        property_batches = [
-            all_props[i: i + batch_size] for i in range(0, len(all_props), batch_size)
-        ]
+        property_batches = (
+            _STATUS_BATCHES if self.hid else _STATUS_BATCHES_WITH_HID
+        )
 
-        self._logger.debug(
-            f"Split properties into {len(property_batches)} batches")
+        self._logger.debug("Split properties into %d batches", len(property_batches))
 
         try:
-            for i, batch in enumerate(property_batches):
-                self._logger.debug(
-                    f"Requesting batch {i + 1}/{len(property_batches)}: {batch}"
-                )
-                # Type check to satisfy pyright
-                if self.device_info is None:
-                    raise DeviceNotBoundError("device_info is None")
-
-                # Send the request and get the response
-                res = await self.send(
-                    self.create_status_message(self.device_info, *batch)
-                )
-                self._logger.debug(
-                    f"Received response for batch {i + 1}: {res}")
+            # Checked once for all batches, the local also narrows the type
+            device_info = self.device_info
+            if device_info is None:
+                raise DeviceNotBoundError("device_info is None")
+
+            # Each batch requests a distinct set of columns and the responses are
+            # merged independently, so all requests can be sent at once
+            await self.send_many(
+                self.create_status_message(device_info, *batch)
+                for batch in property_batches
+            )
 
             self._logger.debug(
-                f"All batches complete. Current device properties: {self._properties}"
+                "All batches complete. Current device properties: %s", self._properties
             )
 
         except asyncio.TimeoutError as err:
             self._logger.error("Timeout while requesting device state")
             raise DeviceTimeoutError from err
         except Exception as e:
-            self._logger.error(f"Error updating state: {e}", exc_info=True)
+            self._logger.error("Error updating state: %s", e, exc_info=True)
             raise
 
     def handle_state_update(self, **kwargs) -> None:
@@ -429,23 +377,33 @@ class AwhpDevice(BaseDevice):
         # Ex: hid = 362001000762+U-CS532AE(LT)V3.31.bin
         if "hid" in kwargs:
             self.hid = kwargs.pop("hid")
-            match = re.search(r"(?<=V)([\d.]+)\.bin$", self.hid or "")
+            match = HID_VERSION_RE.search(self.hid or "")
             if match:
                 self.version = match.group(1)
             self._logger.debug(
                 "Device version changed to %s, hid %s", self.version, self.hid
             )
 
-        # Store previous property values for comparison
-        previous_properties = {k: v for k,
-                               v in self._properties.items() if k in kwargs}
+        # Change tracking below only feeds debug logging, skip it otherwise
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            self._properties.update(kwargs)
+            return
+
+        # Store previous property values for comparison, walking the (small)
+        # update rather than every tracked property
+        properties = self._properties
+        previous_properties = {k: properties.get(k, "N/A") for k in kwargs}
+
+        unknown = [k for k in kwargs if k not in _PROP_VALUE_SET]
+        if unknown:
+            self._logger.debug("Received properties not in AwhpProps: %s", unknown)
 
         # Update properties with new values
         self._properties.update(kwargs)
 
         # Log property changes
         for key, new_value in kwargs.items():
-            old_value = previous_properties.get(key, "N/A")
+            old_value = previous_properties[key]
             if old_value != new_value:
                 self._logger.debug(
                     "Property updated: %s changed from %s to %s",
@@ -454,8 +412,8 @@ class AwhpDevice(BaseDevice):
                 self._logger.debug(
                     "Property unchanged: %s remains %s", key, new_value)
 
-        self._logger.debug("Properties after update: %s",
-                           {k: v for k, v in self._properties.items() if k in kwargs})
+        # The update was merged as-is, so it is exactly the changed slice
+        self._logger.debug("Properties after update: %s", kwargs)
 
     async def push_state_update(self, wait_for: float = 30):
         """Push any pending state updates to the unit
@@ -470,8 +428,7 @@ class AwhpDevice(BaseDevice):
         if not self.device_cipher:
             await self.bind()
 
-        self._logger.debug("Pushing state updates to (%s)",
-                           str(self.device_info))
+        self._logger.debug("Pushing state updates to (%s)", self.device_info)
 
         props = {}
         for name in self._dirty:
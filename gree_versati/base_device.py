@@ -1,16 +1,25 @@
 import asyncio
 import logging
+import re
 from asyncio import AbstractEventLoop
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Optional, Type, Union
 
 from gree_versati.cipher import CipherV1, CipherV2
 from gree_versati.deviceinfo import DeviceInfo
 from gree_versati.exceptions import DeviceNotBoundError, DeviceTimeoutError
-from gree_versati.network import DeviceProtocol2
+from gree_versati.network import DeviceProtocol2, DeviceTransportHub
 from gree_versati.taskable import Taskable
 
 TEMP_OFFSET = 40
 
+# Firmware version from the hid, ex: 362001000762+U-CS532AE(LT)V3.31.bin
+HID_VERSION_RE = re.compile(r"(?<=V)([\d.]+)\.bin$")
+
+# Distinguishes an unset property from one stored as None
+_MISSING = object()
+
+_STATUS_HEADER: Dict[str, Any] = {"cid": "app", "i": 0, "t": "pack", "uid": 0}
+
 
 class BaseDevice(DeviceProtocol2, Taskable):
     """Class representing a physical device, it's state and properties.
@@ -23,21 +32,42 @@ class BaseDevice(DeviceProtocol2, Taskable):
     state from the HVAC, as it is possible that it changes state from other sources.
     """
 
+    # The protocol and task mixins still provide a __dict__, which tests and
+    # callers rely on to patch methods per instance. Slotting the attributes read
+    # on every property access still gives them direct offset lookups.
+    __slots__ = (
+        "_logger",
+        "device_info",
+        "_bind_timeout",
+        "hid",
+        "_version",
+        "_version_major",
+        "check_version",
+        "_properties",
+        "_dirty",
+        "_push_handle",
+        "_hub",
+        "_preferred_cipher",
+    )
+
     def __init__(
         self,
         device_info: Optional[DeviceInfo],
-        timeout: int = 120,
-        bind_timeout: int = 10,
+        timeout: float = 120,
+        bind_timeout: float = 10,
         loop: Optional[AbstractEventLoop] = None,
+        hub: Optional[DeviceTransportHub] = None,
     ):
         """Initialize the device object
 
         Args:
             device_info (DeviceInfo): Information about the physical device
-            timeout (int): Timeout for device communication
-            bind_timeout (int): Timeout for binding to the device, keep this short to
+            timeout (float): Timeout for device communication
+            bind_timeout (float): Timeout for binding to the device, keep this short to
                 prevent delays determining the correct device cipher to use
             loop (AbstractEventLoop): The event loop to run the device operations on
+            hub (DeviceTransportHub): Shared socket to communicate through, if None
+                the device opens its own socket when binding
         """
         DeviceProtocol2.__init__(self, timeout)
         Taskable.__init__(self, loop)
@@ -45,13 +75,30 @@ class BaseDevice(DeviceProtocol2, Taskable):
         self.device_info: Optional[DeviceInfo] = device_info
 
         self._bind_timeout = bind_timeout
+        self._hub = hub
+        # A rebind starts with the cipher type this device last bound with
+        self._preferred_cipher: Type[Union[CipherV1, CipherV2]] = CipherV1
 
         """ Device properties """
         self.hid = None
-        self.version: Optional[str] = None
+        self.version = None
         self.check_version = True
         self._properties: Dict[str, Any] = {}
-        self._dirty: List[str] = []
+        # Keys in the order they were set, so commands list opt/p predictably
+        self._dirty: Dict[str, None] = {}
+        self._push_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def version(self) -> Optional[str]:
+        """Firmware version of the device, if known."""
+        return self._version
+
+    @version.setter
+    def version(self, value: Optional[str]) -> None:
+        self._version = value
+        # Parsed once here, the major version is checked on every temperature read
+        major = value.split(".")[0] if value else ""
+        self._version_major: Optional[int] = int(major) if major.isdigit() else None
 
     async def bind(
         self,
@@ -94,26 +141,33 @@ class BaseDevice(DeviceProtocol2, Taskable):
             raise DeviceNotBoundError
 
         if self._transport is None:
-            self._transport, _ = await self._loop.create_datagram_endpoint(
-                lambda: self, remote_addr=(self.device_info.ip, self.device_info.port)
-            )
+            await self._open_transport(self.device_info)
 
-        self._logger.info("Starting device binding to %s",
-                          str(self.device_info))
+        self._logger.info("Starting device binding to %s", self.device_info)
 
         try:
             if cipher is not None:
                 await self.__bind_internal(cipher)
             else:
-                """ Try binding with CipherV1 first, if that fails try CipherV2"""
+                # Start with the cipher this device last bound with, the other
+                # one is only tried after a bind timeout
+                first = self._preferred_cipher
+                second = CipherV2 if first is CipherV1 else CipherV1
                 try:
                     self._logger.info(
-                        "Attempting to bind to device using CipherV1")
-                    await self.__bind_internal(CipherV1())
+                        "Attempting to bind to device using %s", first.__name__
+                    )
+                    await self.__bind_internal(first())
+                    bound_with = first
                 except asyncio.TimeoutError:
                     self._logger.info(
-                        "Attempting to bind to device using CipherV2")
-                    await self.__bind_internal(CipherV2())
+                        "Attempting to bind to device using %s", second.__name__
+                    )
+                    await self.__bind_internal(second())
+                    bound_with = second
+
+                if self.device_cipher:
+                    self._preferred_cipher = bound_with
 
         except asyncio.TimeoutError as err:
             self._logger.error("Timeout binding to device")
@@ -125,18 +179,23 @@ class BaseDevice(DeviceProtocol2, Taskable):
             self._logger.info("Bound to device using key %s",
                               self.device_cipher.key)
 
+    async def _open_transport(self, device_info: DeviceInfo) -> None:
+        """Connect to the device, through the shared hub when one was given."""
+        addr = (device_info.ip, device_info.port)
+        if self._hub is not None:
+            await self._hub.attach(self, addr)
+        else:
+            self._transport, _ = await self._loop.create_datagram_endpoint(
+                lambda: self, remote_addr=addr
+            )
+
     async def __bind_internal(self, cipher: Union[CipherV1, CipherV2]):
         """Internal binding procedure, do not call directly"""
         if self.device_info is None:
             raise DeviceNotBoundError
         await self.send(self.create_bind_message(self.device_info), cipher=cipher)
-        task = asyncio.create_task(self.ready.wait())
-        try:
-            await asyncio.wait_for(task, timeout=self._bind_timeout)
-        except asyncio.TimeoutError:
-            # Cancel the task if it times out
-            task.cancel()
-            raise
+        async with asyncio.timeout(self._bind_timeout):
+            await self.ready.wait()
 
     def handle_device_bound(self, key: str) -> None:
         """Handle the device bound message from the device"""
@@ -156,43 +215,64 @@ class BaseDevice(DeviceProtocol2, Taskable):
         except asyncio.TimeoutError as err:
             raise DeviceTimeoutError from err
 
+    async def push_state_update(self, wait_for: float = 30):
+        """Push any pending state updates to the unit"""
+        raise NotImplementedError
+
+    def schedule_push(self, delay: float = 0.05) -> None:
+        """Push pending state updates after a short delay
+
+        Properties set before the delay expires are sent together in one message,
+        rather than one datagram per `push_state_update` call. Awaiting
+        `push_state_update` directly still sends immediately.
+
+        Args:
+            delay (float): Seconds to wait for further changes before sending
+        """
+        if self._push_handle is None:
+            self._push_handle = self._loop.call_later(delay, self._flush_push)
+
+    def _flush_push(self) -> None:
+        self._push_handle = None
+        if self._transport is None:
+            # Closed or lost while waiting, the changes stay dirty for later
+            return
+        self._create_task(self.push_state_update())
+
+    def close(self) -> None:
+        """Close the transport, dropping any push still waiting on its delay."""
+        if self._push_handle is not None:
+            self._push_handle.cancel()
+            self._push_handle = None
+        super().close()
+
     def __eq__(self, other):
         """Compare two devices for equality based on their properties state and
         device info."""
-        try:
-            if not isinstance(other, BaseDevice):
-                return False
-            # Different device info means not equal
-            if self.device_info != other.device_info:
-                return False
-            # Different binding state means not equal
-            has_cipher = (
-                hasattr(self, "device_cipher") and self.device_cipher is not None
-            )
-            other_has_cipher = (
-                hasattr(other, "device_cipher") and other.device_cipher is not None
-            )
-            # When any property differs the device info is not the same
-            if has_cipher != other_has_cipher:
-                return False
-            # If both bound, different keys means not equal
-            if (
-                has_cipher
-                and other_has_cipher
-                and self.device_cipher is not None
-                and other.device_cipher is not None
-                and self.device_cipher.key != other.device_cipher.key
-            ):
-                return False
-            # Check if either device has pending property changes
-            if hasattr(self, "_dirty") and self._dirty:
-                return False
-            if hasattr(other, "_dirty") and other._dirty:
-                return False
-            # Finally compare properties
-            return self._properties == other._properties
-        except asyncio.TimeoutError as err:
-            raise DeviceTimeoutError from err
+        if not isinstance(other, BaseDevice):
+            return False
+        # Different device info means not equal
+        if self.device_info != other.device_info:
+            return False
+        # Different binding state means not equal
+        cipher = self.device_cipher
+        other_cipher = other.device_cipher
+        if (cipher is None) != (other_cipher is None):
+            return False
+        # If both bound, different keys means not equal
+        if (
+            cipher is not None
+            and other_cipher is not None
+            and cipher.key != other_cipher.key
+        ):
+            return False
+        # Check if either device has pending property changes
+        if self._dirty or other._dirty:
+            return False
+        # Finally compare properties, skipping the walk when the dict is shared
+        if self._properties is other._properties:
+            return True
+        return self._properties == other._properties
 
     def __ne__(self, other):
         return not self.__eq__(other)
@@ -202,33 +282,38 @@ class BaseDevice(DeviceProtocol2, Taskable):
         return self._properties
 
     def get_property(self, name):
-        """Generic lookup of properties tracked from the physical device"""
-        if self._properties:
-            return self._properties.get(name.value)
-        return None
+        """Generic lookup of properties tracked from the physical device
+
+        Args:
+            name: Property enum member, or its raw key string
+        """
+        return self._properties.get(name if isinstance(name, str) else name.value)
 
     def set_property(self, name, value):
-        """Generic setting of properties for the physical device"""
-        if not self._properties:
-            self._properties = {}
+        """Generic setting of properties for the physical device
 
-        if self._properties.get(name.value) == value:
+        Args:
+            name: Property enum member, or its raw key string
+            value: The new property value
+        """
+        key = name if isinstance(name, str) else name.value
+        properties = self._properties
+        # Compare before storing so callers passing True for a stored 1 are a no-op
+        if properties.get(key, _MISSING) == value:
             return
-        else:
-            self._properties[name.value] = value
-            if name.value not in self._dirty:
-                self._dirty.append(name.value)
+        properties[key] = value
+        self._dirty[key] = None
 
     def create_status_message(self, device_info: DeviceInfo, *args) -> dict:
         """Create a status request message."""
-        self._logger.debug(f"Creating status message with args: {args}")
+        self._logger.debug("Creating status message with args: %s", args)
+        mac = device_info.mac
+        # send() replaces "pack" with the encrypted payload, so every message needs
+        # its own dicts; only the constant header fields are shared
         message = {
-            "cid": "app",
-            "i": 0,
-            "t": "pack",
-            "uid": 0,
-            "tcid": device_info.mac,
-            "pack": {"mac": device_info.mac, "t": "status", "cols": list(args)},
+            **_STATUS_HEADER,
+            "tcid": mac,
+            "pack": {"mac": mac, "t": "status", "cols": list(args)},
         }
-        self._logger.debug(f"Created status message: {message}")
+        self._logger.debug("Created status message: %s", message)
         return message
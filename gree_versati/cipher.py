@@ -1,9 +1,11 @@
-import base64
-import json
+import binascii
 import logging
-from typing import Any, Tuple, Union
+from typing import Any, Optional, Tuple, Union
 
-from Crypto.Cipher import AES
+from Cryptodome.Cipher import AES
+from Cryptodome.Util.Padding import pad
+
+from gree_versati import codec
 
 _logger = logging.getLogger(__name__)
 
@@ -23,6 +25,10 @@ class CipherBase:
     @key.setter
     def key(self, value: str) -> None:
         self._key = value.encode()
+        self._key_changed()
+
+    def _key_changed(self) -> None:
+        """Called after the key is replaced, drop any state derived from it."""
 
     def encrypt(self, data) -> Tuple[str, Union[str, None]]:
         raise NotImplementedError
@@ -34,30 +40,36 @@ class CipherBase:
 class CipherV1(CipherBase):
     def __init__(self, key: bytes = b"a3K8Bx%2r8Y7#xDh") -> None:
         super().__init__(key)
+        self._ecb: Optional[AESEcbMode] = None
 
-    def __create_cipher(self) -> AESEcbMode:  # Use type alias
-        return AES.new(self._key, AES.MODE_ECB)  # type: ignore
+    def _key_changed(self) -> None:
+        self._ecb = None
 
-    def __pad(self, s) -> str:
-        return s + (16 - len(s) % 16) * chr(16 - len(s) % 16)
+    def __create_cipher(self) -> AESEcbMode:  # Use type alias
+        # ECB keeps no state between calls, so the expanded key is reused until
+        # the key changes
+        if self._ecb is None:
+            self._ecb = AES.new(self._key, AES.MODE_ECB)  # type: ignore
+        return self._ecb
 
     def encrypt(self, data) -> Tuple[str, Union[str, None]]:
         _logger.debug("Encrypting data: %s", data)
         cipher = self.__create_cipher()
-        padded = self.__pad(json.dumps(data)).encode()
+        padded = pad(codec.dumps(data), AES.block_size)
         encrypted = cipher.encrypt(padded)  # type: ignore
-        encoded = base64.b64encode(encrypted).decode()
+        encoded = binascii.b2a_base64(encrypted, newline=False).decode()
         _logger.debug("Encrypted data: %s", encoded)
         return encoded, None
 
     def decrypt(self, data) -> dict:
         _logger.debug("Decrypting data: %s", data)
         cipher = self.__create_cipher()
-        decoded = base64.b64decode(data)
+        decoded = binascii.a2b_base64(data)
         decrypted = cipher.decrypt(decoded).decode()  # type: ignore
-        t = decrypted.replace(decrypted[decrypted.rindex("}") + 1 :], "")
+        # Drop the padding after the closing brace, rindex only scans the tail
+        t = decrypted[: decrypted.rindex("}") + 1]
         _logger.debug("Decrypted data: %s", t)
-        return json.loads(t)
+        return codec.loads(t)
 
 
 class CipherV2(CipherBase):
@@ -68,6 +80,7 @@ class CipherV2(CipherBase):
         super().__init__(key)
 
     def __create_cipher(self) -> AESGcmMode:  # Use type alias
+        # GCM objects are single use and cannot be copied, so one is built per call
         cipher = AES.new(self._key, AES.MODE_GCM, nonce=self.GCM_NONCE)  # type: ignore
         cipher.update(self.GCM_AEAD)  # type: ignore
         return cipher
@@ -75,10 +88,10 @@ class CipherV2(CipherBase):
     def encrypt(self, data) -> Tuple[str, str]:
         _logger.debug("Encrypting data: %s", data)
         cipher = self.__create_cipher()
-        encrypted, tag = cipher.encrypt_and_digest(json.dumps(data).encode())  # type: ignore
-        encoded = base64.b64encode(encrypted).decode()
+        encrypted, tag = cipher.encrypt_and_digest(codec.dumps(data))  # type: ignore
+        encoded = binascii.b2a_base64(encrypted, newline=False).decode()
         # Fixed: ensure tag is a string
-        tag_str = base64.b64encode(tag).decode()
+        tag_str = binascii.b2a_base64(tag, newline=False).decode()
         _logger.debug("Encrypted data: %s", encoded)
         _logger.debug("Cipher digest: %s", tag_str)
         return encoded, tag_str  # Return consistent string values
@@ -86,8 +99,9 @@ class CipherV2(CipherBase):
     def decrypt(self, data) -> dict:
         _logger.info("Decrypting data: %s", data)
         cipher = self.__create_cipher()
-        decoded = base64.b64decode(data)
+        decoded = binascii.a2b_base64(data)
         decrypted = cipher.decrypt(decoded).decode()  # type: ignore
-        t = decrypted.replace(decrypted[decrypted.rindex("}") + 1 :], "")
+        # GCM is unpadded, trimmed anyway so trailing bytes from a device are ignored
+        t = decrypted[: decrypted.rindex("}") + 1]
         _logger.debug("Decrypted data: %s", t)
-        return json.loads(t)
+        return codec.loads(t)
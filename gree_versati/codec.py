@@ -0,0 +1,29 @@
+"""JSON encoding used for device datagrams.
+
+orjson is used when it is installed, it serializes straight to bytes and is
+several times faster than the standard library. The stdlib json module is the
+fallback so the dependency stays optional.
+"""
+
+import json
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so this catches both
+JSONDecodeError = json.JSONDecodeError
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes with the standard library."""
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+dumps: Callable[[Any], bytes] = orjson.dumps if orjson is not None else _json_dumps
+loads: Callable[[Union[bytes, str]], Any] = (
+    orjson.loads if orjson is not None else json.loads
+)
@@ -1,11 +1,10 @@
 import asyncio
 import enum
 import logging
-import re
 from enum import IntEnum, unique
 from typing import Optional
 
-from gree_versati.base_device import TEMP_OFFSET, BaseDevice
+from gree_versati.base_device import HID_VERSION_RE, TEMP_OFFSET, BaseDevice
 from gree_versati.exceptions import DeviceNotBoundError, DeviceTimeoutError
 
 
@@ -97,10 +96,46 @@ class Props(enum.Enum):
     UNKNOWN_HEATCOOLTYPE = "HeatCoolType"
 
 
+# Status columns resolved once at import, rather than walking the enum per poll
+_ALL_PROP_VALUES: tuple[str, ...] = tuple(x.value for x in Props)
+_ALL_PROP_VALUES_WITH_HID: tuple[str, ...] = _ALL_PROP_VALUES + ("hid",)
+
+# Property keys used by Device, resolved once instead of per access
+_K_POWER = Props.POWER.value
+_K_MODE = Props.MODE.value
+_K_HUM_SET = Props.HUM_SET.value
+_K_HUM_SENSOR = Props.HUM_SENSOR.value
+_K_CLEAN_FILTER = Props.CLEAN_FILTER.value
+_K_WATER_FULL = Props.WATER_FULL.value
+_K_DEHUMIDIFIER_MODE = Props.DEHUMIDIFIER_MODE.value
+_K_TEMP_SET = Props.TEMP_SET.value
+_K_TEMP_SENSOR = Props.TEMP_SENSOR.value
+_K_TEMP_UNIT = Props.TEMP_UNIT.value
+_K_TEMP_BIT = Props.TEMP_BIT.value
+_K_FAN_SPEED = Props.FAN_SPEED.value
+_K_FRESH_AIR = Props.FRESH_AIR.value
+_K_XFAN = Props.XFAN.value
+_K_ANION = Props.ANION.value
+_K_SLEEP = Props.SLEEP.value
+_K_SLEEP_MODE = Props.SLEEP_MODE.value
+_K_LIGHT = Props.LIGHT.value
+_K_SWING_HORIZ = Props.SWING_HORIZ.value
+_K_SWING_VERT = Props.SWING_VERT.value
+_K_QUIET = Props.QUIET.value
+_K_TURBO = Props.TURBO.value
+_K_STEADY_HEAT = Props.STEADY_HEAT.value
+_K_POWER_SAVE = Props.POWER_SAVE.value
+
+
+_F_TO_C = 5.0 / 9.0
+
+
 def generate_temperature_record(temp_f):
-    temSet = round((temp_f - 32.0) * 5.0 / 9.0)
-    temRec = (int)((((temp_f - 32.0) * 5.0 / 9.0) - temSet) > 0)
-    return {"f": temp_f, "temSet": temSet, "temRec": temRec}
+    # Keep the multiply then divide order, a precomputed 5/9 factor rounds some
+    # fractional Fahrenheit values to a different temSet or temRec
+    c = (temp_f - 32.0) * 5.0 / 9.0
+    temSet = round(c)
+    return {"f": temp_f, "temSet": temSet, "temRec": int(c - temSet > 0)}
 
 
 TEMP_MIN = 8
@@ -111,30 +146,66 @@ TEMP_MIN_TABLE = -60
 TEMP_MAX_TABLE = 60
 TEMP_MIN_TABLE_F = -76
 TEMP_MAX_TABLE_F = 140
+
+# The Fahrenheit conversion table as parallel columns, no per-row dicts
+_TEMP_F: tuple[int, ...] = tuple(range(TEMP_MIN_TABLE_F, TEMP_MAX_TABLE_F + 1))
+_TEMP_C: tuple[float, ...] = tuple((f - 32.0) * _F_TO_C for f in _TEMP_F)
+_TEMP_SET: tuple[int, ...] = tuple(round(c) for c in _TEMP_C)
+_TEMP_REC: tuple[int, ...] = tuple(
+    int(c - temset > 0) for c, temset in zip(_TEMP_C, _TEMP_SET)
+)
+
+# Kept for callers importing the table, Device itself uses the columns above
 TEMP_TABLE = [
-    generate_temperature_record(x)
-    for x in range(TEMP_MIN_TABLE_F, TEMP_MAX_TABLE_F + 1)
+    {"f": f, "temSet": temset, "temRec": temrec}
+    for f, temset, temrec in zip(_TEMP_F, _TEMP_SET, _TEMP_REC)
 ]
+
+
+def _index_temperature_table() -> dict[int, tuple[int, int]]:
+    """Map each temSet to its Fahrenheit value for (temRec 0, temRec 1).
+
+    When a temSet only has one variant it fills both slots, that is the record a
+    scan of the table falls back to for a missing bit.
+    """
+    f_by_bit: tuple[dict[int, int], dict[int, int]] = ({}, {})
+    for f, temset, temrec in zip(_TEMP_F, _TEMP_SET, _TEMP_REC):
+        f_by_bit[temrec].setdefault(temset, f)
+    f0s, f1s = f_by_bit
+    return {
+        temset: (
+            f0s[temset] if temset in f0s else f1s[temset],
+            f1s[temset] if temset in f1s else f0s[temset],
+        )
+        for temset in f0s.keys() | f1s.keys()
+    }
+
+
+_F_BY_TEMSET = _index_temperature_table()
+
 HUMIDITY_MIN = 30
 HUMIDITY_MAX = 80
 
 
 class Device(BaseDevice):
+    # All state lives in the BaseDevice slots
+    __slots__ = ()
+
     @property
     def power(self) -> bool:
-        return bool(self.get_property(Props.POWER))
+        return bool(self._properties.get(_K_POWER))
 
     @power.setter
     def power(self, value: int):
-        self.set_property(Props.POWER, int(value))
+        self.set_property(_K_POWER, int(value))
 
     @property
     def mode(self) -> Optional[int]:
-        return self.get_property(Props.MODE)
+        return self._properties.get(_K_MODE)
 
     @mode.setter
     def mode(self, value: int):
-        self.set_property(Props.MODE, int(value))
+        self.set_property(_K_MODE, int(value))
 
     def _convert_to_units(self, value, bit):
         if self.temperature_units != TemperatureUnits.F.value:
@@ -143,19 +214,13 @@ class Device(BaseDevice):
         if value < TEMP_MIN_TABLE or value > TEMP_MAX_TABLE:
             raise ValueError(f"Specified temperature {value} is out of range.")
 
-        matching_temset = [t for t in TEMP_TABLE if t["temSet"] == value]
-
-        try:
-            f = next(t for t in matching_temset if t["temRec"] == bit)
-        except StopIteration:
-            f = matching_temset[0]
-
-        return f["f"]
+        f0, f1 = _F_BY_TEMSET[value]
+        return f1 if bit == 1 else f0
 
     @property
     def target_temperature(self) -> int:
-        temset = self.get_property(Props.TEMP_SET)
-        temrec = self.get_property(Props.TEMP_BIT)
+        temset = self._properties.get(_K_TEMP_SET)
+        temrec = self._properties.get(_K_TEMP_BIT)
         return self._convert_to_units(temset, temrec)
 
     @target_temperature.setter
@@ -167,28 +232,27 @@ class Device(BaseDevice):
         if self.temperature_units == 1:
             rec = generate_temperature_record(value)
             validate(rec["temSet"])
-            self.set_property(Props.TEMP_SET, rec["temSet"])
-            self.set_property(Props.TEMP_BIT, rec["temRec"])
+            self.set_property(_K_TEMP_SET, rec["temSet"])
+            self.set_property(_K_TEMP_BIT, rec["temRec"])
         else:
             validate(value)
-            self.set_property(Props.TEMP_SET, int(value))
+            self.set_property(_K_TEMP_SET, int(value))
 
     @property
     def temperature_units(self) -> Optional[int]:
-        return self.get_property(Props.TEMP_UNIT)
+        return self._properties.get(_K_TEMP_UNIT)
 
     @temperature_units.setter
     def temperature_units(self, value: int):
-        self.set_property(Props.TEMP_UNIT, int(value))
+        self.set_property(_K_TEMP_UNIT, int(value))
 
     @property
     def current_temperature(self) -> int:
-        prop = self.get_property(Props.TEMP_SENSOR)
-        bit = self.get_property(Props.TEMP_BIT)
+        prop = self._properties.get(_K_TEMP_SENSOR)
+        bit = self._properties.get(_K_TEMP_BIT)
         if prop is not None:
-            v = self.version and int(self.version.split(".")[0])
             try:
-                if v == 4:
+                if self._version_major == 4:
                     return self._convert_to_units(prop, bit)
                 elif prop != 0:
                     return self._convert_to_units(prop - TEMP_OFFSET, bit)
@@ -199,104 +263,104 @@ class Device(BaseDevice):
 
     @property
     def fan_speed(self) -> Optional[int]:
-        return self.get_property(Props.FAN_SPEED)
+        return self._properties.get(_K_FAN_SPEED)
 
     @fan_speed.setter
     def fan_speed(self, value: int):
-        self.set_property(Props.FAN_SPEED, int(value))
+        self.set_property(_K_FAN_SPEED, int(value))
 
     @property
     def fresh_air(self) -> bool:
-        return bool(self.get_property(Props.FRESH_AIR))
+        return bool(self._properties.get(_K_FRESH_AIR))
 
     @fresh_air.setter
     def fresh_air(self, value: bool):
-        self.set_property(Props.FRESH_AIR, int(value))
+        self.set_property(_K_FRESH_AIR, int(value))
 
     @property
     def xfan(self) -> bool:
-        return bool(self.get_property(Props.XFAN))
+        return bool(self._properties.get(_K_XFAN))
 
     @xfan.setter
     def xfan(self, value: bool):
-        self.set_property(Props.XFAN, int(value))
+        self.set_property(_K_XFAN, int(value))
 
     @property
     def anion(self) -> bool:
-        return bool(self.get_property(Props.ANION))
+        return bool(self._properties.get(_K_ANION))
 
     @anion.setter
     def anion(self, value: bool):
-        self.set_property(Props.ANION, int(value))
+        self.set_property(_K_ANION, int(value))
 
     @property
     def sleep(self) -> bool:
-        return bool(self.get_property(Props.SLEEP))
+        return bool(self._properties.get(_K_SLEEP))
 
     @sleep.setter
     def sleep(self, value: bool):
-        self.set_property(Props.SLEEP, int(value))
-        self.set_property(Props.SLEEP_MODE, int(value))
+        self.set_property(_K_SLEEP, int(value))
+        self.set_property(_K_SLEEP_MODE, int(value))
 
     @property
     def light(self) -> bool:
-        return bool(self.get_property(Props.LIGHT))
+        return bool(self._properties.get(_K_LIGHT))
 
     @light.setter
     def light(self, value: bool):
-        self.set_property(Props.LIGHT, int(value))
+        self.set_property(_K_LIGHT, int(value))
 
     @property
     def horizontal_swing(self) -> Optional[int]:
-        return self.get_property(Props.SWING_HORIZ)
+        return self._properties.get(_K_SWING_HORIZ)
 
     @horizontal_swing.setter
     def horizontal_swing(self, value: int):
-        self.set_property(Props.SWING_HORIZ, int(value))
+        self.set_property(_K_SWING_HORIZ, int(value))
 
     @property
     def vertical_swing(self) -> Optional[int]:
-        return self.get_property(Props.SWING_VERT)
+        return self._properties.get(_K_SWING_VERT)
 
     @vertical_swing.setter
     def vertical_swing(self, value: int):
-        self.set_property(Props.SWING_VERT, int(value))
+        self.set_property(_K_SWING_VERT, int(value))
 
     @property
     def quiet(self) -> Optional[bool]:
-        return self.get_property(Props.QUIET)
+        return self._properties.get(_K_QUIET)
 
     @quiet.setter
     def quiet(self, value: bool):
-        self.set_property(Props.QUIET, 2 if value else 0)
+        self.set_property(_K_QUIET, 2 if value else 0)
 
     @property
     def turbo(self) -> bool:
-        return bool(self.get_property(Props.TURBO))
+        return bool(self._properties.get(_K_TURBO))
 
     @turbo.setter
     def turbo(self, value: bool):
-        self.set_property(Props.TURBO, int(value))
+        self.set_property(_K_TURBO, int(value))
 
     @property
     def steady_heat(self) -> bool:
-        return bool(self.get_property(Props.STEADY_HEAT))
+        return bool(self._properties.get(_K_STEADY_HEAT))
 
     @steady_heat.setter
     def steady_heat(self, value: bool):
-        self.set_property(Props.STEADY_HEAT, int(value))
+        self.set_property(_K_STEADY_HEAT, int(value))
 
     @property
     def power_save(self) -> bool:
-        return bool(self.get_property(Props.POWER_SAVE))
+        return bool(self._properties.get(_K_POWER_SAVE))
 
     @power_save.setter
     def power_save(self, value: bool):
-        self.set_property(Props.POWER_SAVE, int(value))
+        self.set_property(_K_POWER_SAVE, int(value))
 
     @property
     def target_humidity(self) -> Optional[int]:
-        value = self.get_property(Props.HUM_SET)
+        value = self._properties.get(_K_HUM_SET)
         if value is not None:
             return 15 + (value * 5)
         return None
@@ -304,26 +368,27 @@ class Device(BaseDevice):
     @target_humidity.setter
     def target_humidity(self, value: int):
         def validate(val):
-            if value > HUMIDITY_MAX or val < HUMIDITY_MIN:
-                raise ValueError(f"Specified temperature {val} is out of range.")
+            if val > HUMIDITY_MAX or val < HUMIDITY_MIN:
+                raise ValueError(f"Specified humidity {val} is out of range.")
 
-        self.set_property(Props.HUM_SET, (value - 15) // 5)
+        validate(value)
+        self.set_property(_K_HUM_SET, (value - 15) // 5)
 
     @property
     def dehumidifier_mode(self):
-        return self.get_property(Props.DEHUMIDIFIER_MODE)
+        return self._properties.get(_K_DEHUMIDIFIER_MODE)
 
     @property
     def current_humidity(self) -> Optional[int]:
-        return self.get_property(Props.HUM_SENSOR)
+        return self._properties.get(_K_HUM_SENSOR)
 
     @property
     def clean_filter(self) -> bool:
-        return bool(self.get_property(Props.CLEAN_FILTER))
+        return bool(self._properties.get(_K_CLEAN_FILTER))
 
     @property
     def water_full(self) -> bool:
-        return bool(self.get_property(Props.WATER_FULL))
+        return bool(self._properties.get(_K_WATER_FULL))
 
     async def update_state(self, wait_for: float = 30):
         """Update the internal state of the device structure of the physical device.
@@ -337,11 +402,9 @@ class Device(BaseDevice):
         if not self.device_cipher:
             await self.bind()
 
-        self._logger.debug("Updating device properties for (%s)", str(self.device_info))
+        self._logger.debug("Updating device properties for (%s)", self.device_info)
 
-        props = [x.value for x in Props]
-        if not self.hid:
-            props.append("hid")
+        props = _ALL_PROP_VALUES if self.hid else _ALL_PROP_VALUES_WITH_HID
 
         try:
             if self.device_info is None:
@@ -358,22 +421,29 @@ class Device(BaseDevice):
         if "hid" in kwargs:
             self.hid = kwargs.pop("hid")
             if self.hid:
-                match = re.search(r"(?<=V)([\d.]+)\.bin$", self.hid)
+                match = HID_VERSION_RE.search(self.hid)
                 self.version = match and match.group(1)
-                self._logger.info(f"Device version is {self.version}, hid {self.hid}")
+                self._logger.info(
+                    "Device version is %s, hid %s", self.version, self.hid
+                )
 
         self._properties.update(kwargs)
 
-        if self.check_version and Props.TEMP_SENSOR.value in kwargs:
+        if self.check_version and _K_TEMP_SENSOR in kwargs:
             self.check_version = False
-            temp = self.get_property(Props.TEMP_SENSOR)
-            self._logger.debug(f"Checking for temperature offset, reported temp {temp}")
+            temp = self._properties.get(_K_TEMP_SENSOR)
+            self._logger.debug(
+                "Checking for temperature offset, reported temp %s", temp
+            )
             if temp and temp < TEMP_OFFSET:
                 self.version = "4.0"
                 self._logger.info(
-                    f"Device version changed to {self.version}, hid {self.hid}"
+                    "Device version changed to %s, hid %s", self.version, self.hid
+                )
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "Using device temperature %s", self.current_temperature
                 )
-            self._logger.debug(f"Using device temperature {self.current_temperature}")
 
     async def push_state_update(self, wait_for: float = 30):
         """Push any pending state updates to the unit
@@ -388,18 +458,17 @@ class Device(BaseDevice):
         if not self.device_cipher:
             await self.bind()
 
-        self._logger.debug("Pushing state updates to (%s)", str(self.device_info))
-
-        props = {}
-        for name in self._dirty:
-            value = self._properties.get(name)
-            self._logger.debug("Sending remote state update %s -> %s", name, value)
-            props[name] = value
-            if name == Props.TEMP_SET.value:
-                props[Props.TEMP_BIT.value] = self._properties.get(Props.TEMP_BIT.value)
-                props[Props.TEMP_UNIT.value] = self._properties.get(
-                    Props.TEMP_UNIT.value
-                )
+        self._logger.debug("Pushing state updates to (%s)", self.device_info)
+
+        properties = self._properties
+        props = {name: properties.get(name) for name in self._dirty}
+        if self._logger.isEnabledFor(logging.DEBUG):
+            for name, value in props.items():
+                self._logger.debug("Sending remote state update %s -> %s", name, value)
+        # The unit and bit are needed by the device to interpret a new setpoint
+        if _K_TEMP_SET in props:
+            props[_K_TEMP_BIT] = properties.get(_K_TEMP_BIT)
+            props[_K_TEMP_UNIT] = properties.get(_K_TEMP_UNIT)
 
         self._dirty.clear()
 
@@ -4,8 +4,9 @@ import logging
 import socket
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+from gree_versati import codec
 from gree_versati.cipher import CipherBase
 from gree_versati.deviceinfo import DeviceInfo
 
@@ -29,6 +30,15 @@ class Response(Enum):
     RESULT = "res"
 
 
+# Commands sent before a device key exists, encrypted with the default key
+_DEFAULT_KEY_COMMANDS = frozenset({Commands.BIND, Commands.SCAN})
+_PACK = Commands.PACK.value
+
+_RESP_BIND_OK = Response.BIND_OK.value
+_RESP_DATA = Response.DATA.value
+_RESP_RESULT = Response.RESULT.value
+
+
 @dataclass
 class IPInterface:
     ip_address: str
@@ -39,15 +49,15 @@ class DeviceProtocolBase2(asyncio.DatagramProtocol):
     """Event driven device protocol class."""
 
     def __init__(
-        self, timeout: int = 10, drained: Optional[asyncio.Event] = None
+        self, timeout: float = 10, drained: Optional[asyncio.Event] = None
     ) -> None:
         """Initialize the device protocol object.
 
         Args:
-            timeout (int): Packet send timeout
+            timeout (float): Packet send timeout
             drained (asyncio.Event): Packet send drain event signal
         """
-        self._timeout: int = timeout
+        self._timeout: float = timeout
         self._drained: asyncio.Event = drained or asyncio.Event()
         self._drained.set()
 
@@ -142,52 +152,49 @@ class DeviceProtocolBase2(asyncio.DatagramProtocol):
             addr (IPAddr): The source address
         """
         # Log first 100 bytes to avoid huge logs
-        _LOGGER.debug(
-            f"Raw datagram received from {addr}: {data[:100]}..."
-        )
+        _LOGGER.debug("Raw datagram received from %s: %.100r...", addr, data)
 
         if len(data) == 0:
             _LOGGER.warning("Received empty datagram")
             return
 
         try:
-            obj = json.loads(data)
-            _LOGGER.debug(f"Decoded JSON: {obj}")
+            obj = codec.loads(data)
+            _LOGGER.debug("Decoded JSON: %s", obj)
 
             if obj.get("pack"):
                 _LOGGER.debug("Attempting to decrypt pack")
                 try:
                     if self._cipher is not None:
                         obj["pack"] = self._cipher.decrypt(obj["pack"])
-                        _LOGGER.debug(f"Decrypted pack: {obj['pack']}")
+                        _LOGGER.debug("Decrypted pack: %s", obj["pack"])
                     else:
                         _LOGGER.warning(
                             "Encrypted data received but no cipher available")
                 except Exception as e:
                     _LOGGER.error(
-                        f"Error decrypting packet: {e}", exc_info=True)
+                        "Error decrypting packet: %s", e, exc_info=True)
 
-            _LOGGER.debug("Received packet from %s:\n<- %s",
-                          addr[0], json.dumps(obj))
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received packet from %s:\n<- %s",
+                              addr[0], json.dumps(obj))
             self.packet_received(obj, addr)
 
-        except json.JSONDecodeError as e:
-            _LOGGER.error(f"Failed to decode JSON from datagram: {e}")
+        except codec.JSONDecodeError as e:
+            _LOGGER.error("Failed to decode JSON from datagram: %s", e)
         except Exception as e:
-            _LOGGER.error(f"Error processing datagram: {e}", exc_info=True)
+            _LOGGER.error("Error processing datagram: %s", e, exc_info=True)
 
-    async def send(
-        self, obj, addr: Optional[IPAddr] = None, cipher: Optional[CipherBase] = None
-    ) -> None:
-        """Send encode and send JSON command to the device.
+    def _encode_packet(self, obj, cipher: Optional[CipherBase] = None) -> bytes:
+        """Encrypt the pack of a JSON command, if any, and serialize it.
 
         Args:
-            obj (dict): Object to send
-            addr (IPAddr, optional): Address to send the message
+            obj (dict): Object to encode
             cipher (CipherBase, optional): Initial cipher to use for SCANNING
                 and BINDING
         """
-        _LOGGER.debug("Sending packet:\n-> %s", json.dumps(obj))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending packet:\n-> %s", json.dumps(obj))
 
         if obj.get("pack"):
             if obj.get("i") == 1:
@@ -205,13 +212,52 @@ class DeviceProtocolBase2(asyncio.DatagramProtocol):
             if tag:
                 obj["tag"] = tag
 
-        data_bytes = json.dumps(obj).encode()
+        return codec.dumps(obj)
+
+    async def _wait_drained(self) -> None:
+        """Wait for the transport to accept writes again, if it is paused."""
+        # Writes are almost never paused, skip creating a waiter in that case
+        if not self._drained.is_set():
+            await asyncio.wait_for(self._drained.wait(), self._timeout)
+
+    async def send(
+        self, obj, addr: Optional[IPAddr] = None, cipher: Optional[CipherBase] = None
+    ) -> None:
+        """Send encode and send JSON command to the device.
+
+        Args:
+            obj (dict): Object to send
+            addr (IPAddr, optional): Address to send the message
+            cipher (CipherBase, optional): Initial cipher to use for SCANNING
+                and BINDING
+        """
+        data_bytes = self._encode_packet(obj, cipher)
         if self._transport is None:
             raise RuntimeError("Transport is not initialized")
         self._transport.sendto(data_bytes, addr)
 
-        task = asyncio.create_task(self._drained.wait())
-        await asyncio.wait_for(task, self._timeout)
+        await self._wait_drained()
+
+    async def send_many(
+        self, objs: Iterable[Dict[str, Any]], addr: Optional[IPAddr] = None
+    ) -> None:
+        """Encode and send several JSON commands to the device back to back.
+
+        All packets are written to the transport in the same event loop turn,
+        and the drain event is only waited on once at the end.
+
+        Args:
+            objs (Iterable[dict]): Objects to send
+            addr (IPAddr, optional): Address to send the messages
+        """
+        packets = [self._encode_packet(obj) for obj in objs]
+        if self._transport is None:
+            raise RuntimeError("Transport is not initialized")
+        sendto = self._transport.sendto
+        for data_bytes in packets:
+            sendto(data_bytes, addr)
+
+        await self._wait_drained()
 
 
 class BroadcastListenerProtocol(DeviceProtocolBase2):
@@ -229,21 +275,22 @@ class BroadcastListenerProtocol(DeviceProtocolBase2):
 class DeviceProtocol2(DeviceProtocolBase2):
     """Protocol handler for direct device communication."""
 
-    _handlers: Dict[Response, list[Callable]] = {}
+    _handlers: Dict[str, List[Callable]]
 
     def __init__(
-        self, timeout: int = 10, drained: Optional[asyncio.Event] = None
+        self, timeout: float = 10, drained: Optional[asyncio.Event] = None
     ) -> None:
         """Initialize the device protocol object.
 
         Args:
-            timeout (int): Packet send timeout
+            timeout (float): Packet send timeout
             drained (asyncio.Event): Packet send drain event signal
         """
         super().__init__(timeout, drained)
         self._ready = asyncio.Event()
         self._ready.clear()
-        self._handlers = {}
+        # Keyed by the raw response type so dispatch needs no enum lookup
+        self._handlers = {r.value: [] for r in Response}
 
     @property
     def ready(self) -> asyncio.Event:
@@ -254,17 +301,14 @@ class DeviceProtocol2(DeviceProtocolBase2):
         if event_name not in Response:
             raise ValueError(f"Invalid event name: {event_name.value}")
 
-        if event_name not in self._handlers:
-            self._handlers[event_name] = []
-        self._handlers[event_name].append(callback)
+        self._handlers[event_name.value].append(callback)
 
     def remove_handler(self, event_name: Response, callback):
         """Remove a specific callback for a specific event."""
         if event_name not in Response:
             raise ValueError(f"Invalid event name: {event_name.value}")
 
-        if event_name in self._handlers:
-            self._handlers[event_name].remove(callback)
+        self._handlers[event_name.value].remove(callback)
 
     def packet_received(self, obj, addr: IPAddr) -> None:
         """Event called when a packet is received and decoded.
@@ -273,39 +317,29 @@ class DeviceProtocol2(DeviceProtocolBase2):
             obj (JSON): Json object with decoded UDP data
             addr (IPAddr): Endpoint address of the sender
         """
-        _LOGGER.debug(f"Packet received from {addr}: {obj}")
+        _LOGGER.debug("Packet received from %s: %s", addr, obj)
 
         try:
-            params = {
-                Response.BIND_OK.value: lambda o, a: [o["pack"]["key"]],
-                Response.DATA.value: lambda o, a: [
-                    dict(zip(o["pack"]["cols"], o["pack"]["dat"]))
-                ],
-                Response.RESULT.value: lambda o, a: [
-                    dict(zip(o["pack"]["opt"], o["pack"]["val"]))
-                ],
-            }
-            handlers = {
-                Response.BIND_OK.value: lambda *args: self.__handle_device_bound(*args),
-                Response.DATA.value: lambda *args: self.__handle_state_update(*args),
-                Response.RESULT.value: lambda *args: self.__handle_state_update(*args),
-            }
-
-            resp = obj.get("pack", {}).get("t")
-            _LOGGER.debug(f"Response type: {resp}")
-
-            handler = handlers.get(resp, self.handle_unknown_packet)
-            _LOGGER.debug(f"Using handler: {handler}")
-
-            param = params.get(resp, lambda o, a: (o, a))(obj, addr)
-            _LOGGER.debug(f"Parsed parameters: {param}")
-
-            handler(*param)
+            pack = obj.get("pack", {})
+            resp = pack.get("t")
+            _LOGGER.debug("Response type: %s", resp)
+
+            if resp == _RESP_DATA:
+                param = dict(zip(pack["cols"], pack["dat"]))
+                self.__handle_state_update(param)
+            elif resp == _RESP_RESULT:
+                param = dict(zip(pack["opt"], pack["val"]))
+                self.__handle_state_update(param)
+            elif resp == _RESP_BIND_OK:
+                param = pack["key"]
+                self.__handle_device_bound(param)
+            else:
+                self.handle_unknown_packet(obj, addr)
+                return
 
             # Call any registered callbacks for this event
-            if resp in handlers:
-                for callback in self._handlers.get(Response(resp), []):
-                    callback(*param)
+            for callback in self._handlers[resp]:
+                callback(param)
         except AttributeError as e:
             _LOGGER.exception("Error while handling packet", exc_info=e)
         except KeyError as e:
@@ -338,17 +372,19 @@ class DeviceProtocol2(DeviceProtocolBase2):
     def _generate_payload(
         self, command: Commands, device_info: DeviceInfo, data: Dict[str, Any]
     ) -> Dict[str, Any]:
-        payload = {
+        mac = device_info.mac
+        i = 1 if command in _DEFAULT_KEY_COMMANDS else 0
+        if data is None:
+            return {"cid": "app", "i": i, "t": command.value, "uid": 0, "tcid": mac}
+        # Built as one literal, the pack fields are merged in the same allocation
+        return {
             "cid": "app",
-            "i": 1 if command in [Commands.BIND, Commands.SCAN] else 0,
-            "t": Commands.PACK.value if data is not None else command.value,
+            "i": i,
+            "t": _PACK,
             "uid": 0,
-            "tcid": device_info.mac,
+            "tcid": mac,
+            "pack": {"t": command.value, "mac": mac, **data},
         }
-        if data is not None:
-            payload["pack"] = {"t": command.value, "mac": device_info.mac}
-            payload["pack"].update(data)
-        return payload
 
     def create_bind_message(self, device_info: DeviceInfo) -> Dict[str, Any]:
         return self._generate_payload(Commands.BIND, device_info, {"uid": 0})
@@ -366,3 +402,139 @@ class DeviceProtocol2(DeviceProtocolBase2):
             device_info,
             {"opt": list(kwargs.keys()), "p": list(kwargs.values())},
         )
+
+
+class _HubTransport(asyncio.DatagramTransport):
+    """Per device view of a DeviceTransportHub socket."""
+
+    def __init__(self, hub: "DeviceTransportHub", addr: IPAddr) -> None:
+        super().__init__()
+        self._hub = hub
+        self._addr = addr
+        self._closing = False
+
+    def sendto(self, data, addr: Optional[IPAddr] = None) -> None:
+        if self._closing:
+            raise RuntimeError("Transport is closed")
+        self._hub.sendto(data, addr or self._addr)
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        return self._hub.get_extra_info(name, default)
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        if not self._closing:
+            self._closing = True
+            self._hub.detach(self._addr)
+
+    def abort(self) -> None:
+        self.close()
+
+
+class DeviceTransportHub(asyncio.DatagramProtocol):
+    """One UDP socket shared by many devices.
+
+    Each device normally opens its own connected socket when it binds. Devices
+    given a hub instead register their address with it and receive a transport
+    that sends through the shared socket. Incoming datagrams are dispatched to
+    the device registered for the source address.
+    """
+
+    def __init__(self, local_addr: IPAddr = ("0.0.0.0", 0)) -> None:
+        """Initialize the hub, the socket is opened on the first attach.
+
+        Args:
+            local_addr (IPAddr): Local address to bind the shared socket to
+        """
+        self._local_addr = local_addr
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._devices: Dict[IPAddr, DeviceProtocolBase2] = {}
+        self._lock = asyncio.Lock()
+
+    @property
+    def devices(self) -> Dict[IPAddr, DeviceProtocolBase2]:
+        """Devices currently attached to the hub, by address."""
+        return self._devices
+
+    async def attach(
+        self, device: DeviceProtocolBase2, addr: IPAddr
+    ) -> asyncio.DatagramTransport:
+        """Register a device and return a transport for it.
+
+        Args:
+            device (DeviceProtocolBase2): Protocol receiving the device datagrams
+            addr (IPAddr): Address the device sends from and is sent to
+
+        Raises:
+            ValueError: Another device is already attached for the address
+        """
+        async with self._lock:
+            if self._transport is None:
+                loop = asyncio.get_running_loop()
+                await loop.create_datagram_endpoint(
+                    lambda: self, local_addr=self._local_addr
+                )
+        if addr in self._devices:
+            raise ValueError(f"A device is already attached for {addr}")
+        self._devices[addr] = device
+        transport = _HubTransport(self, addr)
+        device.connection_made(transport)
+        return transport
+
+    def detach(self, addr: IPAddr) -> None:
+        """Stop dispatching datagrams from an address."""
+        self._devices.pop(addr, None)
+
+    def sendto(self, data, addr: IPAddr) -> None:
+        if self._transport is None:
+            raise RuntimeError("Transport is not initialized")
+        self._transport.sendto(data, addr)
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        if self._transport is None:
+            return default
+        return self._transport.get_extra_info(name, default)
+
+    def close(self) -> None:
+        """Close the shared socket, attached devices are notified."""
+        if self._transport is not None:
+            self._transport.close()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore[assignment]
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self._transport = None
+        try:
+            for addr, device in list(self._devices.items()):
+                try:
+                    device.connection_lost(exc)
+                except Exception as err:
+                    # Devices log and re-raise the socket error, every device
+                    # must still be told the socket is gone
+                    if err is not exc:
+                        _LOGGER.exception(
+                            "Error closing the device at %s", addr, exc_info=err
+                        )
+        finally:
+            self._devices.clear()
+
+    def error_received(self, exc: Exception) -> None:
+        _LOGGER.exception("Shared connection reported an exception", exc_info=exc)
+
+    def pause_writing(self) -> None:
+        for device in self._devices.values():
+            device.pause_writing()
+
+    def resume_writing(self) -> None:
+        for device in self._devices.values():
+            device.resume_writing()
+
+    def datagram_received(self, data: bytes, addr: IPAddr) -> None:
+        device = self._devices.get(addr)
+        if device is None:
+            _LOGGER.debug("Dropping datagram from unknown address %s", addr)
+            return
+        device.datagram_received(data, addr)
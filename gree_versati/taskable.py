@@ -9,6 +9,20 @@ from typing import List, Optional
 _LOGGER = logging.getLogger(__name__)
 
 
+def use_uvloop() -> None:
+    """Run new event loops on uvloop.
+
+    uvloop is an optional dependency, install it with the `uvloop` extra. Call
+    this before the loop is created, devices pick up whichever loop is running.
+
+    Raises:
+        ImportError: uvloop is not installed
+    """
+    import uvloop  # type: ignore[import-not-found]
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 class Taskable:
     """Mixin class for objects that can be run as tasks."""
 
@@ -20,6 +20,7 @@ setuptools.setup(
     name="gree_versati",
     python_requires=">=3.11",
     install_requires=requirements,
+    extras_require={"uvloop": ["uvloop"]},
     author="Jukka Roihuvaara",
     author_email="",
     version=version,
@@ -1,3 +1,4 @@
+import copy
 import socket
 from socket import SOCK_DGRAM
 from typing import Tuple, Union
@@ -71,7 +72,7 @@ DEFAULT_RESPONSE = {
 
 def generate_response(data):
     """Generate a response from a request."""
-    response = DEFAULT_RESPONSE.copy()
+    response = copy.deepcopy(DEFAULT_RESPONSE)
     response["pack"].update(data)
     return response
 
@@ -132,3 +133,39 @@ class Responder:
         """Exit the context manager."""
         if self.sock:
             self.sock.close()
+
+
+class SocketPool:
+    """Pre-bound loopback UDP sockets, shared by the tests of a session.
+
+    Each acquire hands out a duplicate of a pooled socket, so the transport built
+    on it can close its copy while the bound socket stays in the pool.
+    """
+
+    def __init__(self, size: int = 2, host: str = "127.0.0.1") -> None:
+        """Initialize the class."""
+        self._socks = []
+        for _ in range(size):
+            sock = socket.socket(socket.AF_INET, SOCK_DGRAM)
+            sock.setblocking(False)
+            sock.bind((host, 0))
+            self._socks.append(sock)
+        self._next = 0
+
+    def acquire(self) -> socket.socket:
+        """Return a duplicate of the next pooled socket."""
+        sock = self._socks[self._next % len(self._socks)]
+        self._next += 1
+        # Drop anything still queued from the last test that used this socket
+        try:
+            while True:
+                sock.recv(2048)
+        except BlockingIOError:
+            pass
+        return sock.dup()
+
+    def close(self) -> None:
+        """Close the pooled sockets."""
+        for sock in self._socks:
+            sock.close()
+        self._socks.clear()
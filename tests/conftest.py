@@ -1,42 +1,113 @@
 """Pytest module configuration."""
 
-from unittest.mock import patch
+import asyncio
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import netifaces
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is an optional test dependency
+    uvloop = None  # type: ignore[assignment]
+
+import gree_versati.cipher as cipher_module
 from gree_versati.device import Device
-from tests.common import FakeCipher
+from tests.common import FakeCipher, SocketPool
 
 MOCK_INTERFACES = ["lo"]
-MOCK_LO_IFACE = {
-    2: [{"addr": "10.0.0.1", "netmask": "255.0.0.0", "peer": "10.255.255.255"}]
-}
+# Read-only so a test cannot leak changes to the shared value into the next one
+MOCK_LO_IFACE = MappingProxyType(
+    {2: ({"addr": "10.0.0.1", "netmask": "255.0.0.0", "peer": "10.255.255.255"},)}
+)
 
+_CIPHER_KEY = b"1234567890123456"
 
-@pytest.fixture(name="netifaces")
-def netifaces_fixture():
-    """Patch netifaces interface discover."""
+# Shared by every test using the cipher fixture, they are built once per session
+_FAKE_CIPHER = FakeCipher(_CIPHER_KEY)
+_MOCK_CIPHER1 = MagicMock(return_value=_FAKE_CIPHER)
+_MOCK_CIPHER2 = MagicMock(return_value=_FAKE_CIPHER)
+
+
+@pytest.fixture(name="netifaces_session", scope="session")
+def netifaces_session_fixture():
+    """Patch netifaces interface discover once for the whole session."""
     with (
-        patch("netifaces.interfaces", return_value=MOCK_INTERFACES),
-        patch("netifaces.ifaddresses", return_value=MOCK_LO_IFACE) as ifaddr_mock,
+        patch.object(netifaces, "interfaces", return_value=MOCK_INTERFACES),
+        patch.object(
+            netifaces, "ifaddresses", return_value=MOCK_LO_IFACE
+        ) as ifaddr_mock,
     ):
         yield ifaddr_mock
 
 
+@pytest.fixture(name="netifaces")
+def netifaces_fixture(netifaces_session):
+    """Patch netifaces interface discover."""
+    # Tests replace the return value, restore it rather than re-patching
+    netifaces_session.reset_mock()
+    netifaces_session.return_value = MOCK_LO_IFACE
+    return netifaces_session
+
+
+def _patch_cipher(name: str, mock: MagicMock):
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cipher_module, name, mock)
+        yield mock
+
+
+@pytest.fixture(name="cipher_v1_session", scope="session")
+def cipher_v1_session_fixture():
+    """Patch CipherV1 once for the whole session."""
+    yield from _patch_cipher("CipherV1", _MOCK_CIPHER1)
+
+
+@pytest.fixture(name="cipher_v2_session", scope="session")
+def cipher_v2_session_fixture():
+    """Patch CipherV2 once for the whole session."""
+    yield from _patch_cipher("CipherV2", _MOCK_CIPHER2)
+
+
+@pytest.fixture(name="mock_cipher_v1")
+def mock_cipher_v1_fixture(cipher_v1_session):
+    """Patch only CipherV1, for tests of a single protocol version."""
+    cipher_v1_session.reset_mock()
+    return cipher_v1_session
+
+
+@pytest.fixture(name="mock_cipher_v2")
+def mock_cipher_v2_fixture(cipher_v2_session):
+    """Patch only CipherV2, for tests of a single protocol version."""
+    cipher_v2_session.reset_mock()
+    return cipher_v2_session
+
+
 @pytest.fixture(name="cipher")
-def cipher_fixture():
+def cipher_fixture(mock_cipher_v1, mock_cipher_v2):
     """Patch the cipher object."""
-    with (
-        patch("gree_versati.cipher.CipherV1") as mock1,
-        patch("gree_versati.cipher.CipherV2") as mock2,
-    ):
-        mock1.return_value = FakeCipher(b"1234567890123456")
-        mock2.return_value = FakeCipher(b"1234567890123456")
-        yield mock1, mock2
+    return mock_cipher_v1, mock_cipher_v2
 
 
 @pytest.fixture(name="send")
-def network_fixture():
+def network_fixture(monkeypatch):
     """Patch the device object."""
-    with patch.object(Device, "send") as mock:
-        yield mock
+    mock = AsyncMock()
+    monkeypatch.setattr(Device, "send", mock)
+    return mock
+
+
+@pytest.fixture(name="socket_pool", scope="session")
+def socket_pool_fixture():
+    """Bound UDP sockets reused by the network tests."""
+    pool = SocketPool()
+    yield pool
+    pool.close()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run the async tests on uvloop when it is installed."""
+    if uvloop is None:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
@@ -1,5 +1,8 @@
 import asyncio
-from unittest.mock import Mock, patch
+import logging
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -21,8 +24,14 @@ def get_mock_info():
     )
 
 
-def get_mock_state():
-    return {
+# Tests only read these or replace the device's reference, so they are shared
+_DEV_INFO = DeviceInfo("1.1.1.1", 7000, "f4911e7aca59", "1e7aca59")
+_MOCK_DEV_INFO = DeviceInfo(*get_mock_info())
+
+
+# Built once, callers that modify the state take a copy
+_MOCK_STATE = MappingProxyType(
+    {
         "AllInWatTemHi": 125,  # 25°C
         "AllInWatTemLo": 5,  # 0.5°C
         "AllOutWatTemHi": 126,  # 26°C
@@ -70,31 +79,69 @@ def get_mock_state():
         "EVU": 0,
         "hid": "362001000762+U-CS532AE(LT)V3.31.bin",
     }
+)
+
+
+def get_mock_state():
+    return _MOCK_STATE
+
+
+# Response returned by the send mocks, do not modify it
+_OK_RESPONSE = MappingProxyType({"t": "status", "pack": {}})
+
+
+def ok_send_mock() -> AsyncMock:
+    """Mock for send or send_many that succeeds."""
+    return AsyncMock(return_value=_OK_RESPONSE)
+
 
+# No test changes these keys, so one instance of each is shared by all of them
+_TEST_CIPHER = CipherV1(b"St8Vw1Yz4Bc7Ef0H")
+_BIND_CIPHER = CipherV1(b"test_key")
 
-async def generate_device_mock_async():
-    d = AwhpDevice(DeviceInfo("1.1.1.1", 7000, "f4911e7aca59", "1e7aca59"))
+
+def _fake_transport() -> Any:
+    """Transport stub, the tests never inspect what is written to it."""
+    return SimpleNamespace(sendto=lambda *args, **kwargs: None, close=lambda: None)
+
+
+def _force_cipher(device, cipher) -> None:
+    """Set the device cipher directly, bypassing the device_cipher setter."""
+    object.__setattr__(device, "_cipher", cipher)
+
+
+def _dirty_one(device, key: str, value) -> None:
+    """Leave the device holding a single property with a pending change."""
+    device._properties = {key: value}
+    device._dirty = {key: None}
+
+
+async def generate_device_mock_async(timeout: float = 0.01):
+    d = AwhpDevice(_DEV_INFO, timeout=timeout)
     # Set up transport
-    d._transport = Mock()
-    d._transport.sendto = Mock()
+    d._transport = _fake_transport()
 
     # Set up initial state
-    state = get_mock_state()
-    d._properties = state.copy()
+    d._properties = get_mock_state().copy()
 
     # Set up cipher with key
-    d.device_cipher = CipherV1("St8Vw1Yz4Bc7Ef0H".encode())
+    d.device_cipher = _TEST_CIPHER
     d.ready.set()
     return d
 
 
+@pytest.fixture(name="device")
+async def device_fixture():
+    """A bound device with the mock state loaded."""
+    return await generate_device_mock_async()
+
+
 @pytest.mark.asyncio
-async def test_get_device_info(cipher, send):
+async def test_get_device_info(send):
     """Initialize device, check properties."""
-    info = DeviceInfo(*get_mock_info())
+    info = _MOCK_DEV_INFO
     device = AwhpDevice(info)
-    device._transport = Mock()
-    device._transport.sendto = Mock()
+    device._transport = _fake_transport()
 
     assert device.device_info == info
 
@@ -111,15 +158,14 @@ async def test_get_device_info(cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_device_bind(cipher, send):
+async def test_device_bind():
     """Check that the device returns a device key when binding."""
-    info = DeviceInfo(*get_mock_info())
+    info = _MOCK_DEV_INFO
     device = AwhpDevice(info, timeout=1)
     fake_key = "abcdefgh12345678"
 
     # Set up mock transport
-    device._transport = Mock()
-    device._transport.sendto = Mock()
+    device._transport = _fake_transport()
 
     try:
         assert device.device_info == info
@@ -134,20 +180,19 @@ async def test_device_bind(cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_device_bind_timeout(monkeypatch, cipher, send):
+async def test_device_bind_timeout():
     """Check that the device handles timeout errors when binding."""
-    info = DeviceInfo(*get_mock_info())
-    device = AwhpDevice(info, timeout=1)
+    info = _MOCK_DEV_INFO
+    device = AwhpDevice(info, timeout=1, bind_timeout=0.01)
 
     # Set up mock transport
-    device._transport = Mock()
-    device._transport.sendto = Mock()
+    device._transport = _fake_transport()
 
     # Replace the __bind_internal method with one that raises TimeoutError
     async def mock_bind_internal(*args, **kwargs):
         raise asyncio.TimeoutError("Test timeout")
 
-    # Using monkeypatch to patch the private method
+    # Patch the name-mangled private method
     with patch.object(
         device, "_BaseDevice__bind_internal", side_effect=mock_bind_internal
     ):
@@ -162,10 +207,8 @@ async def test_device_bind_timeout(monkeypatch, cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_update_properties(monkeypatch, cipher, send):
+async def test_update_properties(device):
     """Check that properties can be updated."""
-    device = await generate_device_mock_async()
-
     # Clear properties to test update
     device._properties = {}
 
@@ -178,8 +221,8 @@ async def test_update_properties(monkeypatch, cipher, send):
         device._properties.update(mock_state)
         return {"t": "status", "pack": mock_state}
 
-    # Patch the device's send method
-    with patch.object(device, "send", side_effect=mock_send):
+    # Patch the device's send_many method
+    with patch.object(device, "send_many", side_effect=mock_send):
         # Call update_state which will use our mocked send method
         await device.update_state()
 
@@ -190,30 +233,29 @@ async def test_update_properties(monkeypatch, cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_update_state_timeout(monkeypatch, cipher, send):
+async def test_update_state_timeout(device):
     """Test handling of timeout during state update."""
-    device = await generate_device_mock_async()
 
     # Mock send method that raises TimeoutError
     async def mock_send(*args, **kwargs):
         raise asyncio.TimeoutError("Test timeout")
 
-    # Patch the device's send method
-    with patch.object(device, "send", side_effect=mock_send):
+    # Patch the device's send_many method
+    with patch.object(device, "send_many", side_effect=mock_send):
         # This should be converted to DeviceTimeoutError by the device
         with pytest.raises(DeviceTimeoutError):
             await device.update_state()
 
 
 @pytest.mark.asyncio
-async def test_push_state_timeout(monkeypatch, cipher, send):
+async def test_push_state_timeout(device):
     """Test handling of timeout during state push."""
-    device = await generate_device_mock_async()
-
     # Set some properties to make the device dirty
     device.cool_temp_set = 20
     device.heat_temp_set = 35
-    device._dirty = [AwhpProps.COOL_TEMP_SET.value, AwhpProps.HEAT_TEMP_SET.value]
+    device._dirty = dict.fromkeys(
+        (AwhpProps.COOL_TEMP_SET.value, AwhpProps.HEAT_TEMP_SET.value)
+    )
 
     # Mock send method that raises TimeoutError
     async def mock_send(*args, **kwargs):
@@ -225,53 +267,34 @@ async def test_push_state_timeout(monkeypatch, cipher, send):
             await device.push_state_update()
 
 
-@pytest.mark.asyncio
-async def test_temperature_readings(cipher, send):
-    """Test temperature conversion functions."""
-    device = await generate_device_mock_async()
+TEMP_CASES = [
+    ("t_water_in_pe", 25.5),
+    ("t_water_out_pe", 26.3),
+    ("t_opt_water", 27.2),
+    ("hot_water_temp", 28.1),
+    ("remote_home_temp", 29.4),
+]
 
-    # Clear properties
-    device._properties = {}
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method,expected", TEMP_CASES)
+async def test_temperature_readings(device, method, expected):
+    """Test temperature conversion functions."""
     # Directly update device properties, matching test_device.py pattern
     device._properties = get_mock_state().copy()
 
-    # Test water input temperature (25.5°C)
-    assert device.t_water_in_pe() == 25.5
-
-    # Test water output temperature (26.3°C)
-    assert device.t_water_out_pe() == 26.3
-
-    # Test optimal water temperature (27.2°C)
-    assert device.t_opt_water() == 27.2
-
-    # Test hot water temperature (28.1°C)
-    assert device.hot_water_temp() == 28.1
-
-    # Test remote home temperature (29.4°C)
-    assert device.remote_home_temp() == 29.4
+    assert getattr(device, method)() == expected
 
 
 @pytest.mark.asyncio
-async def test_temperature_settings(monkeypatch, cipher, send):
+async def test_temperature_settings(device):
     """Check the setting of temperature setpoints."""
-    device = await generate_device_mock_async()
-
     # Clear properties and dirty list
     device._properties = {}
-    device._dirty = []
-
-    # Create a call counter to track the number of send calls
-    call_count = 0
-
-    # Mock send method to track calls and return success
-    async def mock_send(*args, **kwargs):
-        nonlocal call_count
-        call_count += 1
-        return {"t": "status", "pack": {}}
+    device._dirty = {}
 
     # Patch the device's send method
-    with patch.object(device, "send", side_effect=mock_send):
+    with patch.object(device, "send", new=ok_send_mock()) as mock_send:
         # Test getting current values works
         assert device.cool_temp_set is None  # No properties yet
 
@@ -295,17 +318,15 @@ async def test_temperature_settings(monkeypatch, cipher, send):
         await device.push_state_update()
 
         # Verify one send call was made (for the push_state_update)
-        assert call_count == 1
+        assert mock_send.call_count == 1
 
         # Dirty list should be empty after push
         assert len(device._dirty) == 0
 
 
 @pytest.mark.asyncio
-async def test_device_status_properties(cipher, send):
+async def test_device_status_properties(device):
     """Test various device status properties."""
-    device = await generate_device_mock_async()
-
     # Directly set properties
     device._properties = get_mock_state().copy()
 
@@ -326,10 +347,64 @@ async def test_device_status_properties(cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_update_all_properties(monkeypatch, cipher, send):
-    """Check that all properties can be updated."""
-    device = await generate_device_mock_async()
+async def test_create_status_message(device):
+    """Test status messages are built fresh for every request."""
+    assert device.device_info is not None
+    mac = device.device_info.mac
+
+    first = device.create_status_message(device.device_info, "Pow")
+    second = device.create_status_message(device.device_info, "Mod")
+
+    assert first == {
+        "cid": "app",
+        "i": 0,
+        "t": "pack",
+        "uid": 0,
+        "tcid": mac,
+        "pack": {"mac": mac, "t": "status", "cols": ["Pow"]},
+    }
+    # Encrypting one message must not affect another
+    first["pack"] = "encrypted"
+    assert second["pack"]["cols"] == ["Mod"]
+
+
+@pytest.mark.asyncio
+async def test_device_property_descriptors(device):
+    """Test generated properties set values and reject writes to status fields."""
+    device._properties = {AwhpProps.FAST_HEAT_WATER.value: 1}
+    device._dirty.clear()
 
+    # Setting an unchanged value does not mark the property dirty
+    device.fast_heat_water = True
+    assert device._dirty == {}
+
+    device.fast_heat_water = False
+    device.cool_temp_set = 21
+    assert device._properties[AwhpProps.FAST_HEAT_WATER.value] == 0
+    assert device._properties[AwhpProps.COOL_TEMP_SET.value] == 21
+    assert list(device._dirty) == [
+        AwhpProps.FAST_HEAT_WATER.value,
+        AwhpProps.COOL_TEMP_SET.value,
+    ]
+
+    # Raw key strings are accepted alongside the enum members
+    device.set_property(AwhpProps.QUIET.value, 1)
+    assert device.get_property(AwhpProps.QUIET.value) == 1
+    assert device.get_property(AwhpProps.QUIET) == 1
+
+    # An explicit None is still a change for a property never reported
+    device.set_property(AwhpProps.REMOTE_HOME_TEMP_W, None)
+    assert AwhpProps.REMOTE_HOME_TEMP_W.value in device._dirty
+
+    with pytest.raises(AttributeError):
+        device.tank_heater_status = True
+    with pytest.raises(AttributeError):
+        device.all_err = 1
+
+
+@pytest.mark.asyncio
+async def test_update_all_properties(device):
+    """Check that all properties can be updated."""
     # Clear properties to test update
     device._properties = {}
 
@@ -342,8 +417,8 @@ async def test_update_all_properties(monkeypatch, cipher, send):
         device._properties.update(mock_state)
         return {"t": "status", "pack": mock_state}
 
-    # Patch the device's send method
-    with patch.object(device, "send", side_effect=mock_send):
+    # Patch the device's send_many method
+    with patch.object(device, "send_many", side_effect=mock_send):
         # Call update_all_properties which will use our mocked send method
         await device.update_all_properties()
 
@@ -359,14 +434,11 @@ async def test_update_all_properties(monkeypatch, cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_temperature_readings_with_none(cipher, send):
+async def test_temperature_readings_with_none(device):
     """Test temperature readings when some values are None."""
-    device = await generate_device_mock_async()
-
     # Prepare modified state
-    modified_state = get_mock_state().copy()
-    del modified_state["AllInWatTemHi"]
-    del modified_state["AllInWatTemLo"]
+    missing = {"AllInWatTemHi", "AllInWatTemLo"}
+    modified_state = {k: v for k, v in _MOCK_STATE.items() if k not in missing}
 
     # Directly set properties
     device._properties = modified_state
@@ -379,61 +451,68 @@ async def test_temperature_readings_with_none(cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_batch_property_updates(monkeypatch, cipher, send):
-    """Check that properties can be updated in batches."""
-    device = await generate_device_mock_async()
+async def test_all_temperatures(device):
+    """Test all temperatures match the individual accessors."""
+    state = get_mock_state().copy()
+    del state["AllInWatTemLo"]
+    device._properties = state
+
+    assert device.all_temperatures() == {
+        "t_water_in_pe": None,
+        "t_water_out_pe": 26.3,
+        "t_opt_water": 27.2,
+        "hot_water_temp": 28.1,
+        "remote_home_temp": 29.4,
+    }
+    assert device.all_temperatures(get_mock_state())["t_water_in_pe"] == 25.5
 
-    # Clear properties to test update
-    device._properties = {}
-    device._dirty = []
 
-    # Create a call counter to track the number of send calls
-    call_count = 0
-    sent_props = []
+# 25 properties, enough to force batching
+_BATCH_PROPS = tuple(str(i) for i in range(1, 26))
+_BATCH_SET = frozenset(_BATCH_PROPS)
 
-    # Mock send method to track calls and capture sent properties
-    async def mock_send(*args, **kwargs):
-        nonlocal call_count, sent_props
-        call_count += 1
 
-        # Get the message to determine which properties were requested
-        message = args[0]
-        if "pack" in message:
-            pack = message["pack"]
-            if "opt" in pack and isinstance(pack["opt"], list):
-                # This is a state update with opt list
-                sent_props.extend(pack["opt"])
+@pytest.mark.asyncio
+async def test_batch_property_updates(device):
+    """Check that properties can be updated in batches."""
+    # Clear properties to test update
+    device._properties = {}
+    device._dirty = {}
 
-        # Return a mock state that changes based on which properties were requested
-        return {"t": "status", "pack": {"1": 1, "2": 2, "4": 4, "5": 5, "6": 6}}
+    send_mock = AsyncMock(
+        return_value={"t": "status", "pack": {"1": 1, "2": 2, "4": 4, "5": 5, "6": 6}}
+    )
 
     # Patch the device's send method
-    with patch.object(device, "send", side_effect=mock_send):
+    with patch.object(device, "send", new=send_mock):
         # Add many properties to the dirty list to ensure multiple batches
-        # Add 25 properties to force batching (assuming batch size < 25)
-        props = [str(i) for i in range(1, 26)]
-        device._dirty = props.copy()  # Create a copy to preserve original
-        original_props = props.copy()  # Store original properties
+        device._dirty = dict.fromkeys(_BATCH_PROPS)
 
         # Push state update, which should trigger batch requests
         await device.push_state_update()
 
-        # Verify that at least one call was made
-        assert call_count >= 1
+    # Verify that at least one call was made
+    assert send_mock.await_count >= 1
+
+    # Collect the properties from every command message that was sent
+    sent_props = sum(
+        (
+            c.args[0]["pack"]["opt"]
+            for c in send_mock.await_args_list
+            if "opt" in c.args[0].get("pack", {})
+        ),
+        [],
+    )
 
-        # Make sure all our properties were sent
-        assert len(sent_props) > 0
-        # If properties weren't batched properly, this would fail
-        # Compare with original_props since device._dirty is
-        # cleared after push_state_update
-        assert set(sent_props) == set(original_props)
+    # Make sure all our properties were sent
+    assert len(sent_props) > 0
+    # If properties weren't batched properly, this would fail
+    assert frozenset(sent_props) == _BATCH_SET
 
 
 @pytest.mark.asyncio
-async def test_temperature_readings_raw_data(cipher, send):
+async def test_temperature_readings_raw_data(device):
     """Test temperature readings using raw data."""
-    device = await generate_device_mock_async()
-
     # Test direct temperature calculation with raw data
     raw_data = {
         "AllInWatTemHi": 130,  # 30°C
@@ -451,10 +530,8 @@ async def test_temperature_readings_raw_data(cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_device_version_handling(cipher, send):
+async def test_device_version_handling(device):
     """Test device version extraction from hid."""
-    device = await generate_device_mock_async()
-
     # Set the HID directly
     device._properties = {"hid": "362001000762+U-CS532AE(LT)V3.31.bin"}
 
@@ -465,14 +542,10 @@ async def test_device_version_handling(cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_invalid_temperature_values(cipher, send):
+async def test_invalid_temperature_values(device):
     """Test handling of invalid temperature values."""
-    device = await generate_device_mock_async()
-
     # Set up state with invalid temperature values
-    modified_state = get_mock_state().copy()
-    modified_state["AllInWatTemHi"] = None
-    modified_state["AllInWatTemLo"] = None
+    modified_state = {**_MOCK_STATE, "AllInWatTemHi": None, "AllInWatTemLo": None}
 
     # Directly set properties
     device._properties = modified_state
@@ -483,10 +556,8 @@ async def test_invalid_temperature_values(cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_additional_status_properties(cipher, send):
+async def test_additional_status_properties(device):
     """Test all the additional status getter properties."""
-    device = await generate_device_mock_async()
-
     # Directly set properties
     device._properties = get_mock_state().copy()
 
@@ -539,10 +610,8 @@ async def test_additional_status_properties(cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_property_none_values(cipher, send):
+async def test_property_none_values(device):
     """Test handling of None values in property getters."""
-    device = await generate_device_mock_async()
-
     # Clear the properties
     device._properties = {}
 
@@ -565,10 +634,27 @@ async def test_property_none_values(cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_all_properties_in_get_all_properties(monkeypatch, cipher, send):
-    """Test that get_all_properties includes all the properties."""
-    device = await generate_device_mock_async()
+async def test_properties_view(device):
+    """Test the properties view reads live values without copying."""
+    device._properties = {AwhpProps.POWER.value: 1, "hid": "ignored"}
+    view = device.properties
 
+    assert len(view) == len(AwhpProps)
+    assert list(view) == [p.value for p in AwhpProps]
+    assert view[AwhpProps.POWER.value] == 1
+    assert view[AwhpProps.MODE.value] is None
+    assert "hid" not in view
+    with pytest.raises(KeyError):
+        view["hid"]
+
+    device.handle_state_update(Mod=4)
+    assert view[AwhpProps.MODE.value] == 4
+    assert view == dict.fromkeys(view) | {"Pow": 1, "Mod": 4}
+
+
+@pytest.mark.asyncio
+async def test_all_properties_in_get_all_properties(device):
+    """Test that get_all_properties includes all the properties."""
     # Setup mock properties with all values
     mock_state = get_mock_state().copy()
     device._properties = mock_state
@@ -628,13 +714,11 @@ async def test_all_properties_in_get_all_properties(monkeypatch, cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_property_setters(monkeypatch, cipher, send):
+async def test_property_setters(device):
     """Test setters for temperature and boolean properties."""
-    device = await generate_device_mock_async()
-
     # Clear properties and dirty list
     device._properties = {}
-    device._dirty = []
+    device._dirty = {}
 
     # Test setting all settable properties
     device.cool_temp_set = 19
@@ -741,25 +825,15 @@ async def test_property_setters(monkeypatch, cipher, send):
         assert prop in device._dirty
 
     # Test a basic push update
-    mock_call_count = 0
-
-    async def mock_send(*args, **kwargs):
-        nonlocal mock_call_count
-        mock_call_count += 1
-        return {"t": "status", "pack": {}}
-
-    # Patch the device's send method
-    with patch.object(device, "send", side_effect=mock_send):
+    with patch.object(device, "send", new=ok_send_mock()) as mock_send:
         await device.push_state_update()
-        assert mock_call_count == 1
+        assert mock_send.call_count == 1
         assert len(device._dirty) == 0
 
 
 @pytest.mark.asyncio
-async def test_temperature_raw_data_advanced(cipher, send):
+async def test_temperature_raw_data_advanced(device):
     """Test all temperature reading methods with raw data argument."""
-    device = await generate_device_mock_async()
-
     # Test all temperature methods with raw data
     raw_data = {
         "AllInWatTemHi": 130,  # 30°C
@@ -804,26 +878,23 @@ async def test_temperature_raw_data_advanced(cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_update_state_general_exception(monkeypatch, cipher, send):
+async def test_update_state_general_exception(device):
     """Test handling of general exceptions during state update."""
-    device = await generate_device_mock_async()
 
     # Mock send method that raises a general exception
     async def mock_send(*args, **kwargs):
         raise RuntimeError("Test general exception")
 
-    # Patch the device's send method
-    with patch.object(device, "send", side_effect=mock_send):
+    # Patch the device's send_many method
+    with patch.object(device, "send_many", side_effect=mock_send):
         # Should log the error and re-raise the exception
         with pytest.raises(RuntimeError, match="Test general exception"):
             await device.update_state()
 
 
 @pytest.mark.asyncio
-async def test_update_state_device_info_none(monkeypatch, cipher, send):
+async def test_update_state_device_info_none(device):
     """Test handling when device_info is None."""
-    device = await generate_device_mock_async()
-
     # Force device_info to be None
     device.device_info = None
 
@@ -833,12 +904,10 @@ async def test_update_state_device_info_none(monkeypatch, cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_push_state_update_device_info_none(monkeypatch, cipher, send):
+async def test_push_state_update_device_info_none(device):
     """Test push state update when device_info is None."""
-    device = await generate_device_mock_async()
-
     # Set some property to make device dirty
-    device._dirty = ["Pow"]  # Directly set the dirty list
+    _dirty_one(device, "Pow", 1)
 
     # Force device_info to None
     device.device_info = None
@@ -856,10 +925,8 @@ async def test_push_state_update_device_info_none(monkeypatch, cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_handle_state_update_no_hid(cipher, send):
+async def test_handle_state_update_no_hid(device):
     """Test handle_state_update without HID in the update."""
-    device = await generate_device_mock_async()
-
     # Clear the version and hid
     device.version = None
     device.hid = None
@@ -877,10 +944,31 @@ async def test_handle_state_update_no_hid(cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_handle_state_update_invalid_hid(cipher, send):
-    """Test handle_state_update with invalid HID format."""
-    device = await generate_device_mock_async()
+async def test_handle_state_update_debug_disabled(caplog, device):
+    """Test handle_state_update still merges state when debug logging is off."""
+    caplog.set_level(logging.INFO, logger=device._logger.name)
+
+    device.handle_state_update(Pow=0, Mod=1)
+
+    assert device.power is False
+    assert device.mode == 1
+    assert not caplog.records
 
+
+@pytest.mark.asyncio
+async def test_handle_state_update_unknown_property(caplog, device):
+    """Test properties missing from AwhpProps are stored and reported."""
+    caplog.set_level(logging.DEBUG, logger=device._logger.name)
+
+    device.handle_state_update(Pow=1, NewProp=5)
+
+    assert device.raw_properties["NewProp"] == 5
+    assert "Received properties not in AwhpProps: ['NewProp']" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_handle_state_update_invalid_hid(device):
+    """Test handle_state_update with invalid HID format."""
     # Send an update with malformed hid that doesn't match version pattern
     device.handle_state_update(hid="invalid_hid_format")
 
@@ -890,235 +978,148 @@ async def test_handle_state_update_invalid_hid(cipher, send):
 
 
 @pytest.mark.asyncio
-async def test_push_state_update_no_dirty(monkeypatch, cipher, send):
+async def test_push_state_update_no_dirty(device):
     """Test push_state_update when nothing is dirty."""
-    device = await generate_device_mock_async()
-
     # Clear dirty list
-    device._dirty = []
-
-    # Mock send to track calls
-    mock_calls = 0
-
-    async def mock_send(*args, **kwargs):
-        nonlocal mock_calls
-        mock_calls += 1
-        return {"t": "status", "pack": {}}
+    device._dirty = {}
 
     # Patch send
-    with patch.object(device, "send", side_effect=mock_send):
+    with patch.object(device, "send", new=ok_send_mock()) as mock_send:
         # Push update with empty dirty list
         await device.push_state_update()
 
         # Should return early without calling send
-        assert mock_calls == 0
+        assert mock_send.call_count == 0
 
 
 @pytest.mark.asyncio
-async def test_update_state_no_cipher(monkeypatch, cipher, send):
+async def test_update_state_no_cipher(device):
     """Test update_state when device_cipher is None."""
-    device = await generate_device_mock_async()
-
     # Set device_cipher to None - bypassing the setter to avoid type errors
-    device.__dict__["_cipher"] = None
-
-    # Mock bind to track calls
-    bind_called = False
+    _force_cipher(device, None)
 
-    async def mock_bind(*args, **kwargs):
-        nonlocal bind_called
-        bind_called = True
-        device.__dict__["_cipher"] = CipherV1("test_key".encode())
-
-    # Patch bind
-    with patch.object(device, "bind", side_effect=mock_bind):
-        # Mock send to return success
-        async def mock_send(*args, **kwargs):
-            return {"t": "status", "pack": {}}
+    def mock_bind(*args, **kwargs):
+        _force_cipher(device, _BIND_CIPHER)
 
-        # Patch send
-        with patch.object(device, "send", side_effect=mock_send):
-            await device.update_state()
+    bind = AsyncMock(side_effect=mock_bind)
+    send_many = ok_send_mock()
+    with patch.multiple(device, bind=bind, send_many=send_many):
+        await device.update_state()
 
-            # Should call bind before sending
-            assert bind_called is True
+    # Should call bind before sending
+    bind.assert_awaited_once()
+    send_many.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_push_state_no_cipher(monkeypatch, cipher, send):
+async def test_push_state_no_cipher(device):
     """Test push_state_update when device_cipher is None."""
-    device = await generate_device_mock_async()
 
-    # Create a flag to track bind calls
-    bind_called = False
-
-    # Create a wrapper for bind
-    async def bind_wrapper(*args, **kwargs):
-        nonlocal bind_called
-        bind_called = True
+    def mock_bind(*args, **kwargs):
         # Set the device_cipher so the rest of the method can continue
-        device.__dict__["_cipher"] = CipherV1("test_key".encode())
-        # Don't actually call the original bind, as it will attempt network operations
-        return None
+        _force_cipher(device, _BIND_CIPHER)
 
-    # Clear dirty flags
-    device._dirty = []
-    device._properties = get_mock_state().copy()
+    _dirty_one(device, "Pow", 1)
+    # Set device_cipher to None - directly accessing the _cipher attribute
+    _force_cipher(device, None)
 
-    # Mock the bind method to detect calls
-    with patch.object(device, "bind", side_effect=bind_wrapper):
-        # Set device_cipher to None - directly accessing the _cipher attribute
-        device.__dict__["_cipher"] = None
-
-        # Make device dirty
-        device._dirty = ["Pow"]
-
-        # Mock send to succeed
-        async def mock_send(*args, **kwargs):
-            return {"t": "status", "pack": {}}
-
-        # Patch send
-        with patch.object(device, "send", side_effect=mock_send):
-            # Now push state, which should call bind
-            await device.push_state_update()
-
-            # Verify bind was called
-            assert bind_called is True
+    bind = AsyncMock(side_effect=mock_bind)
+    send_mock = ok_send_mock()
+    with patch.multiple(device, bind=bind, send=send_mock):
+        await device.push_state_update()
 
-            # Verify dirty list was cleared
-            assert len(device._dirty) == 0
+    bind.assert_awaited_once()
+    assert len(device._dirty) == 0
+
+
+SETTER_CASES = (
+    ("cool_temp_set", 18, AwhpProps.COOL_TEMP_SET, 18),
+    ("heat_temp_set", 33, AwhpProps.HEAT_TEMP_SET, 33),
+    ("cool_home_temp_set", 24, AwhpProps.COOL_HOME_TEMP_SET, 24),
+    ("heat_home_temp_set", 25, AwhpProps.HEAT_HOME_TEMP_SET, 25),
+    ("fast_heat_water", True, AwhpProps.FAST_HEAT_WATER, 1),
+    ("left_home", True, AwhpProps.LEFT_HOME, 1),
+    ("disinfect", True, AwhpProps.DISINFECT, 1),
+    ("power_save", True, AwhpProps.POWER_SAVE, 1),
+    ("versati_series", True, AwhpProps.VERSATI_SERIES, 1),
+    ("room_home_temp_ext", True, AwhpProps.ROOM_HOME_TEMP_EXT, 1),
+    ("hot_water_ext", True, AwhpProps.HOT_WATER_EXT, 1),
+    ("foc_mod_swh", True, AwhpProps.FOC_MOD_SWH, 1),
+    ("emegcy", True, AwhpProps.EMEGCY, 1),
+    ("hand_fro_swh", True, AwhpProps.HAND_FRO_SWH, 1),
+    ("water_sys_exh_swh", True, AwhpProps.WATER_SYS_EXH_SWH, 1),
+    ("power", True, AwhpProps.POWER, 1),
+    ("mode", 1, AwhpProps.MODE, 1),
+    ("cool_and_hot_water", True, AwhpProps.COOL_AND_HOT_WATER, 1),
+    ("heat_and_hot_water", True, AwhpProps.HEAT_AND_HOT_WATER, 1),
+)
 
 
 @pytest.mark.asyncio
-async def test_remaining_setters(cipher, send):
-    """Test the few remaining setter methods that need coverage."""
-    device = await generate_device_mock_async()
-    device._properties = {}  # Clear properties for clean test
-    device._dirty = []  # Clear dirty list
-
-    # The key is to actually execute each of these lines
-    # Line 149
-    device.cool_temp_set = 18
-    assert device._properties[AwhpProps.COOL_TEMP_SET.value] == 18
-
-    # Line 157
-    device.heat_temp_set = 33
-    assert device._properties[AwhpProps.HEAT_TEMP_SET.value] == 33
-
-    # Line 181
-    device.cool_home_temp_set = 24
-    assert device._properties[AwhpProps.COOL_HOME_TEMP_SET.value] == 24
-
-    # Line 189
-    device.heat_home_temp_set = 25
-    assert device._properties[AwhpProps.HEAT_HOME_TEMP_SET.value] == 25
-
-    # Line 189
-    device.fast_heat_water = True
-    assert device._properties[AwhpProps.FAST_HEAT_WATER.value] == 1
-
-    # Line 207
-    device.left_home = True
-    assert device._properties[AwhpProps.LEFT_HOME.value] == 1
-
-    # Line 215
-    device.disinfect = True
-    assert device._properties[AwhpProps.DISINFECT.value] == 1
-
-    # Line 223
-    device.power_save = True
-    assert device._properties[AwhpProps.POWER_SAVE.value] == 1
-
-    # Line 231
-    device.versati_series = True
-    assert device._properties[AwhpProps.VERSATI_SERIES.value] == 1
-
-    # Line 239
-    device.room_home_temp_ext = True
-    assert device._properties[AwhpProps.ROOM_HOME_TEMP_EXT.value] == 1
-
-    # Line 247
-    device.hot_water_ext = True
-    assert device._properties[AwhpProps.HOT_WATER_EXT.value] == 1
-
-    # Line 255
-    device.foc_mod_swh = True
-    assert device._properties[AwhpProps.FOC_MOD_SWH.value] == 1
+@pytest.mark.parametrize("attr,value,prop,expected", SETTER_CASES)
+async def test_remaining_setters(attr, value, prop, expected, device):
+    """Test each setter stores the device value and marks it dirty."""
+    device._properties = {}
+    device._dirty = {}
 
-    # Line 263
-    device.emegcy = True
-    assert device._properties[AwhpProps.EMEGCY.value] == 1
+    setattr(device, attr, value)
+    assert device._properties[prop.value] == expected
+    assert list(device._dirty) == [prop.value]
 
-    # Line 271
-    device.hand_fro_swh = True
-    assert device._properties[AwhpProps.HAND_FRO_SWH.value] == 1
 
-    # Line 279
-    device.water_sys_exh_swh = True
-    assert device._properties[AwhpProps.WATER_SYS_EXH_SWH.value] == 1
+@pytest.mark.asyncio
+async def test_remaining_setters_all_dirty(device):
+    """Test setting every property marks each one dirty."""
+    device._properties = {}
+    device._dirty = {}
 
-    # Line 321
-    device.power = True
-    assert device._properties[AwhpProps.POWER.value] == 1
+    for attr, value, _, _ in SETTER_CASES:
+        setattr(device, attr, value)
+    assert len(device._dirty) == len(SETTER_CASES)
 
-    # Line 329
-    device.mode = 1
-    assert device._properties[AwhpProps.MODE.value] == 1
+    # And that they can be read without error
+    get_property = device.get_property
+    for prop in AwhpProps:
+        get_property(prop)
 
-    # Line (cool + hot)
-    device.cool_and_hot_water = True
-    assert device._properties[AwhpProps.COOL_AND_HOT_WATER.value] == 1
 
-    # Line (heat + hot)
-    device.heat_and_hot_water = True
-    assert device._properties[AwhpProps.HEAT_AND_HOT_WATER.value] == 1
+@pytest.mark.asyncio
+async def test_setters_use_set_property(device):
+    """Test descriptor setters go through set_property."""
+    device._properties = {}
+    device._dirty = {}
 
-    # Verify that all properties have been set
-    assert len(device._dirty) == 19
+    # None for a key never seen is still a change
+    device.cool_temp_set = None
+    assert list(device._dirty) == [AwhpProps.COOL_TEMP_SET.value]
 
-    # And that they can be read without error
-    for prop in AwhpProps:
-        # This will implicitly test all getters
-        device.get_property(prop)
+    with patch.object(device, "set_property") as set_property:
+        device.power = True
+    set_property.assert_called_once_with(AwhpProps.POWER.value, 1)
 
 
 @pytest.mark.asyncio
-async def test_no_cipher_for_push_state(cipher, send):
+async def test_no_cipher_for_push_state():
     """Test the device_cipher is None in push_state_update."""
     # Create a new device from scratch
-    device = AwhpDevice(DeviceInfo("1.1.1.1", 7000, "f4911e7aca59", "1e7aca59"))
+    device = AwhpDevice(_DEV_INFO)
 
     # Set up mock transport
-    device._transport = Mock()
-    device._transport.sendto = Mock()
+    device._transport = _fake_transport()
 
     # Ensure device_cipher is None
     assert device.device_cipher is None
 
-    # Mock bind to track calls
-    bind_called = False
-
-    async def mock_bind(*args, **kwargs):
-        nonlocal bind_called
-        bind_called = True
-        device.device_cipher = CipherV1("test_key".encode())
+    def mock_bind(*args, **kwargs):
+        device.device_cipher = _BIND_CIPHER
         device.ready.set()
 
-    # Patch device's bind method
-    with patch.object(device, "bind", side_effect=mock_bind):
-        # Create a mock send that returns success
-        async def mock_send(*args, **kwargs):
-            return {"t": "status", "pack": {}}
-
-        # Patch send method
-        with patch.object(device, "send", side_effect=mock_send):
-            # Make a property dirty
-            device._properties = {}
-            device._dirty = ["Pow"]
-            device._properties["Pow"] = 1
-
-            # Call push_state_update - this should trigger bind
-            await device.push_state_update()
+    _dirty_one(device, "Pow", 1)
+
+    bind = AsyncMock(side_effect=mock_bind)
+    send_mock = ok_send_mock()
+    with patch.multiple(device, bind=bind, send=send_mock):
+        # Call push_state_update - this should trigger bind
+        await device.push_state_update()
 
-            # Verify bind was called
-            assert bind_called is True
+    bind.assert_awaited_once()
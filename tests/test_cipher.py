@@ -57,3 +57,28 @@ def test_cipher_base_not_implemented():
 
     with pytest.raises(NotImplementedError):
         CipherBase(fake_key).decrypt(None)
+
+
+def test_cipher_v1_key_change_resets_cached_cipher(cipher_v1, plain_text):
+    encrypted, _ = cipher_v1.encrypt(plain_text)
+    assert cipher_v1.decrypt(encrypted) == plain_text
+
+    cipher_v1.key = "AnotherSecretKey"
+    reencrypted, _ = cipher_v1.encrypt(plain_text)
+
+    assert reencrypted != encrypted
+    assert cipher_v1.decrypt(reencrypted) == plain_text
+    assert CipherV1(b"AnotherSecretKey").encrypt(plain_text)[0] == reencrypted
+
+
+def test_cipher_v1_reuses_ecb_context(cipher_v1, plain_text):
+    first, _ = cipher_v1.encrypt(plain_text)
+    ecb = cipher_v1._ecb
+    assert ecb is not None
+
+    # Interleaved calls on the shared context stay independent
+    assert cipher_v1.decrypt(first) == plain_text
+    second, _ = cipher_v1.encrypt(plain_text)
+
+    assert cipher_v1._ecb is ecb
+    assert second == first
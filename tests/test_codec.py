@@ -0,0 +1,15 @@
+import pytest
+
+from gree_versati import codec
+
+
+def test_dumps_returns_bytes_that_round_trip():
+    obj = {"t": "pack", "i": 0, "pack": {"cols": ["Pow", "Mod"]}}
+    data = codec.dumps(obj)
+    assert isinstance(data, bytes)
+    assert codec.loads(data) == obj
+
+
+def test_loads_invalid_data_raises_json_decode_error():
+    with pytest.raises(codec.JSONDecodeError):
+        codec.loads(b"{not json")
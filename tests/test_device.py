@@ -1,10 +1,19 @@
 import asyncio
 import enum
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from gree_versati.cipher import CipherV1
-from gree_versati.device import Device, Props, TemperatureUnits
+from gree_versati.cipher import CipherV1, CipherV2
+from gree_versati.device import (
+    TEMP_MAX_TABLE_F,
+    TEMP_MIN_TABLE_F,
+    TEMP_TABLE,
+    Device,
+    Props,
+    TemperatureUnits,
+    generate_temperature_record,
+)
 from gree_versati.deviceinfo import DeviceInfo
 from gree_versati.exceptions import DeviceNotBoundError, DeviceTimeoutError
 
@@ -230,11 +239,72 @@ async def test_device_bind(cipher, send):
     assert send.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_device_bind_prefers_last_cipher(send):
+    """Check that a rebind starts with the cipher type the device last used."""
+    tried = []
+
+    def fake_send(*args, cipher=None, **kwargs):
+        tried.append(type(cipher))
+        if isinstance(cipher, CipherV2):
+            device.device_cipher = cipher
+            device.ready.set()
+
+    send.side_effect = fake_send
+
+    device = Device(DeviceInfo(*get_mock_info()), bind_timeout=0.01)
+    await device.bind()
+    assert tried == [CipherV1, CipherV2]
+
+    tried.clear()
+    device.ready.clear()
+    await device.bind()
+    assert tried == [CipherV2]
+
+    # The preference belongs to the device, a new one starts with CipherV1
+    tried.clear()
+    device = Device(DeviceInfo(*get_mock_info()), bind_timeout=0.01)
+    await device.bind()
+    assert tried == [CipherV1, CipherV2]
+
+
+@pytest.mark.asyncio
+async def test_device_bind_interleaved_ciphers():
+    """Check binding a V1 and a V2 device in turn does not flip either one."""
+    tried = []
+
+    def make_device(name: str, accepts: type[CipherV1] | type[CipherV2]) -> Device:
+        device = Device(DeviceInfo(*get_mock_info()), bind_timeout=0.01)
+
+        def fake_send(*args, cipher=None, **kwargs):
+            tried.append((name, type(cipher)))
+            if isinstance(cipher, accepts):
+                device.device_cipher = cipher
+                device.ready.set()
+
+        device.send = AsyncMock(side_effect=fake_send)
+        return device
+
+    devices = [make_device("v1", CipherV1), make_device("v2", CipherV2)]
+    for _ in range(2):
+        for device in devices:
+            device.ready.clear()
+            await device.bind()
+
+    assert tried == [
+        ("v1", CipherV1),
+        ("v2", CipherV1),
+        ("v2", CipherV2),
+        ("v1", CipherV1),
+        ("v2", CipherV2),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_device_bind_timeout(cipher, send):
     """Check that the device handles timeout errors when binding."""
     info = DeviceInfo(*get_mock_info())
-    device = Device(info, timeout=1)
+    device = Device(info, timeout=1, bind_timeout=0.01)
 
     with pytest.raises(DeviceTimeoutError):
         await device.bind()
@@ -409,6 +479,73 @@ async def test_set_properties(cipher, send):
             assert device.get_property(p) == get_mock_state_on()[p.value]
 
 
+@pytest.mark.asyncio
+async def test_set_properties_keeps_order(cipher, send):
+    """Check the command lists properties in the order they were set."""
+    device = await generate_device_mock_async()
+
+    device.quiet = True
+    device.power = False
+    device.light = True
+    device.fan_speed = 2
+
+    await device.push_state_update()
+
+    pack = send.call_args.args[0]["pack"]
+    assert pack["opt"] == ["Quiet", "Pow", "Lig", "WdSpd"]
+    assert pack["p"] == [2, 0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_set_humidity_out_of_range(cipher, send):
+    """Check that an out of range target humidity is rejected."""
+    device = await generate_device_mock_async()
+
+    with pytest.raises(ValueError):
+        device.target_humidity = 85
+
+    with pytest.raises(ValueError):
+        device.target_humidity = 25
+
+    device.target_humidity = 45
+    assert device.target_humidity == 45
+
+
+@pytest.mark.asyncio
+async def test_schedule_push_coalesces_updates(cipher, send):
+    """Check that scheduled pushes within the delay are sent as one message."""
+    device = await generate_device_mock_async()
+    device.connection_made(MagicMock())
+
+    device.power = False
+    device.schedule_push(delay=0)
+    device.mode = 2
+    device.schedule_push(delay=0)
+
+    await asyncio.sleep(0.01)
+    await asyncio.gather(*device.tasks)
+
+    send.assert_called_once()
+    assert device._dirty == {}
+
+
+@pytest.mark.asyncio
+async def test_schedule_push_dropped_on_close(cipher, send):
+    """Check that closing the device before the delay expires sends nothing."""
+    device = await generate_device_mock_async()
+    device.connection_made(MagicMock())
+
+    device.power = False
+    device.schedule_push(delay=0.01)
+    device.close()
+    assert device._push_handle is None
+
+    await asyncio.sleep(0.02)
+
+    send.assert_not_called()
+    assert list(device._dirty) == ["Pow"]
+
+
 @pytest.mark.asyncio
 async def test_set_properties_timeout(cipher, send):
     """Check timeout handling when pushing state changes."""
@@ -691,6 +828,27 @@ async def test_enable_disable_sleep_mode(cipher, send):
     assert device.get_property(Props.SLEEP_MODE) == 0
 
 
+def test_temperature_table_compat():
+    """Check TEMP_TABLE still holds one record per whole Fahrenheit degree."""
+    assert TEMP_TABLE == [
+        generate_temperature_record(f)
+        for f in range(TEMP_MIN_TABLE_F, TEMP_MAX_TABLE_F + 1)
+    ]
+
+
+@pytest.mark.parametrize(
+    "temp_f,temset,temrec",
+    [(58.1, 14, 1), (66.2, 19, 0), (75.2, 24, 0), (85.1, 30, 0), (-40.9, -40, 0)],
+)
+def test_generate_temperature_record_fractional(temp_f, temset, temrec):
+    """Check fractional Fahrenheit values keep their original rounding."""
+    assert generate_temperature_record(temp_f) == {
+        "f": temp_f,
+        "temSet": temset,
+        "temRec": temrec,
+    }
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("temperature", [59, 77, 86])
 async def test_mismatch_temrec_farenheit(temperature, cipher, send):
@@ -1,4 +1,5 @@
 import asyncio
+import copy
 import json
 import socket
 from threading import Thread
@@ -17,6 +18,9 @@ from .common import (
     get_mock_device_info,
 )
 
+# Discovery always scans port 7000, keep these tests in one pytest-xdist worker
+pytestmark = pytest.mark.xdist_group("discovery_port")
+
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("addr,family", [(("127.0.0.1", 7000), socket.AF_INET)])
@@ -39,7 +43,7 @@ async def test_discover_devices(netifaces, addr, family):
             assert p == DISCOVERY_REQUEST
 
             for d in devices:
-                r = DISCOVERY_RESPONSE.copy()
+                r = copy.deepcopy(DISCOVERY_RESPONSE)
                 r["pack"].update(d)
                 p = json.dumps(encrypt_payload(r))
                 s.sendto(p.encode(), addr)
@@ -90,7 +94,7 @@ async def test_discover_deduplicate_multiple_discoveries(netifaces, addr, family
             assert p == DISCOVERY_REQUEST
 
             for d in devices:
-                r = DISCOVERY_RESPONSE.copy()
+                r = copy.deepcopy(DISCOVERY_RESPONSE)
                 r["pack"].update(d)
                 p = json.dumps(encrypt_payload(r))
                 s.sendto(p.encode(), addr)
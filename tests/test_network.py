@@ -1,18 +1,19 @@
 import asyncio
 import json
 import socket
-from threading import Thread
 from typing import cast
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from gree_versati import codec
 from gree_versati.deviceinfo import DeviceInfo
 from gree_versati.network import (
     BroadcastListenerProtocol,
     Commands,
     DeviceProtocol2,
     DeviceProtocolBase2,
+    DeviceTransportHub,
     IPAddr,
     Response,
 )
@@ -29,16 +30,79 @@ from .common import (
 )
 from .test_device import get_mock_info
 
+# Discovery port, tests expecting no answer send here. Under pytest-xdist they run
+# with the discovery tests in one worker, see setup.cfg.
+_DISCOVERY_ADDR = ("127.0.0.1", 7000)
+_DISCOVERY_PORT_GROUP = pytest.mark.xdist_group("discovery_port")
+
+# Sender address for packets handed straight to packet_received
+_NULL_ADDR = ("0.0.0.0", 0)
+
+# No test changes the key, so one cipher is shared by all of them
+_FAKE_CIPHER = FakeCipher(b"1234567890123456")
+
+# Wire encodings of the constant messages, the responders only replay these
+_DISCOVERY_REQUEST_BYTES = codec.dumps(DISCOVERY_REQUEST)
+_DISCOVERY_RESPONSE_BYTES = codec.dumps(DISCOVERY_RESPONSE)
+_DEFAULT_RESPONSE_BYTES = codec.dumps(DEFAULT_RESPONSE)
+
+
+class _ReplyOnce(asyncio.DatagramProtocol):
+    """Reply to the first datagram received, and pass it to a future."""
+
+    def __init__(self, reply: bytes, received: asyncio.Future) -> None:
+        self.reply = reply
+        self.received = received
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        if self.transport is None or self.received.done():
+            return
+        self.transport.sendto(self.reply, addr)
+        self.received.set_result(data)
+
+
+async def _one_shot_responder(sock: socket.socket, reply: bytes, expected=None):
+    """Answer a single datagram on a Responder socket from the event loop."""
+    # A datagram endpoint rather than loop.sock_recvfrom, which uvloop lacks
+    loop = asyncio.get_running_loop()
+    received = loop.create_future()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _ReplyOnce(reply, received), sock=sock
+    )
+    try:
+        data = await received
+    finally:
+        transport.close()
+    if expected is not None:
+        assert data == expected
+
+
+def _local_addr(sock: socket.socket):
+    """Loopback address of a Responder socket bound to an ephemeral port."""
+    return ("127.0.0.1", sock.getsockname()[1])
+
+
+def _start_responder(sock: socket.socket, reply: bytes, expected=None):
+    """Run a one shot responder on the loop, in place of a responder thread."""
+    sock.setblocking(False)
+    return asyncio.create_task(_one_shot_responder(sock, reply, expected))
+
 
 class FakeDiscoveryProtocol(BroadcastListenerProtocol):
     """Fake discovery class."""
 
     def __init__(self):
         super().__init__(timeout=1, drained=asyncio.Event())
-        self.packets: asyncio.Queue = asyncio.Queue()
+        # Each test waits on a single packet
+        self.packet: asyncio.Future = asyncio.get_running_loop().create_future()
 
     def packet_received(self, obj, addr: IPAddr) -> None:
-        self.packets.put_nowait(obj)
+        if not self.packet.done():
+            self.packet.set_result(obj)
 
 
 class FakeDeviceProtocol(DeviceProtocol2):
@@ -46,29 +110,27 @@ class FakeDeviceProtocol(DeviceProtocol2):
 
     def __init__(self, drained: asyncio.Event | None = None):
         super().__init__(timeout=1, drained=drained or asyncio.Event())
-        self.packets: asyncio.Queue = asyncio.Queue()
-        self.device_cipher = FakeCipher(b"1234567890123456")
+        # Each test waits on a single packet
+        self.packet: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.device_cipher = _FAKE_CIPHER
 
     def packet_received(self, obj, addr: IPAddr) -> None:
-        self.packets.put_nowait(obj)
+        if not self.packet.done():
+            self.packet.set_result(obj)
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("addr,family", [(("127.0.0.1", 7000), socket.AF_INET)])
-async def test_close_connection(addr, family):
+@_DISCOVERY_PORT_GROUP
+async def test_close_connection(socket_pool):
     """Test closing the connection."""
     # Run the listener portion now
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
-    bcast = (addr[0], 7000)
-    local_addr = (addr[0], 0)
+    bcast = _DISCOVERY_ADDR
 
     with patch.object(DeviceProtocolBase2, "connection_lost") as mock:
         dp2 = FakeDiscoveryProtocol()
-        await loop.create_datagram_endpoint(
-            lambda: dp2,
-            local_addr=local_addr,
-        )
+        await loop.create_datagram_endpoint(lambda: dp2, sock=socket_pool.acquire())
 
         # Send the scan command
         data = DISCOVERY_REQUEST
@@ -77,7 +139,7 @@ async def test_close_connection(addr, family):
 
         # Wait on the scan response
         with pytest.raises(asyncio.TimeoutError):
-            task = asyncio.create_task(dp2.packets.get())
+            task = dp2.packet
             await asyncio.wait_for(task, DEFAULT_TIMEOUT)
             (response, _) = task.result()
 
@@ -100,20 +162,19 @@ async def test_set_get_key():
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("addr", [(("127.0.0.1", 7001))])
-async def test_connection_error(addr):
+@_DISCOVERY_PORT_GROUP
+async def test_connection_error(socket_pool):
     """Test the encryption key property."""
     dp2 = DeviceProtocolBase2()
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     transport, _ = await loop.create_datagram_endpoint(
-        lambda: dp2,
-        local_addr=addr,
+        lambda: dp2, sock=socket_pool.acquire()
     )
 
     # Send the scan command
     data = DISCOVERY_REQUEST
-    await dp2.send(data, (addr[0], 7000))
+    await dp2.send(data, _DISCOVERY_ADDR)
 
     with pytest.raises(RuntimeError):
         dp2.connection_lost(RuntimeError())
@@ -121,16 +182,14 @@ async def test_connection_error(addr):
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("addr", [(("127.0.0.1", 7001))])
-async def test_pause_resume(addr):
+async def test_pause_resume(socket_pool):
     """Test the encryption key property."""
     event = asyncio.Event()
     dp2 = DeviceProtocolBase2(drained=event)
 
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     transport, _ = await loop.create_datagram_endpoint(
-        lambda: dp2,
-        local_addr=addr,
+        lambda: dp2, sock=socket_pool.acquire()
     )
 
     dp2.pause_writing()
@@ -144,78 +203,57 @@ async def test_pause_resume(addr):
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("addr,family", [(("127.0.0.1", 7000), socket.AF_INET)])
-async def test_broadcast_recv(addr, family):
+async def test_broadcast_recv(socket_pool):
     """Create a socket broadcast responder and an async broadcast listener.
 
     Tests discovery responses from the network.
     """
-    with Responder(family, addr[1]) as sock:
-
-        def responder(s):
-            (d, addr) = s.recvfrom(2048)
-            p = json.loads(d)
-            assert p == DISCOVERY_REQUEST
-
-            p = json.dumps(DISCOVERY_RESPONSE)
-            s.sendto(p.encode(), addr)
-
-        serv = Thread(target=responder, args=(sock,))
-        serv.start()
+    with Responder(socket.AF_INET, 0) as sock:
+        serv = _start_responder(
+            sock, _DISCOVERY_RESPONSE_BYTES, expected=_DISCOVERY_REQUEST_BYTES
+        )
 
         # Run the listener portion now
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
-        bcast = (addr[0], 7000)
-        local_addr = (addr[0], 0)
+        bcast = _local_addr(sock)
 
         dp2 = FakeDiscoveryProtocol()
-        dp2.device_cipher = FakeCipher(b"1234567890123456")
-        await loop.create_datagram_endpoint(
-            lambda: dp2,
-            local_addr=local_addr,
-        )
+        dp2.device_cipher = _FAKE_CIPHER
+        await loop.create_datagram_endpoint(lambda: dp2, sock=socket_pool.acquire())
 
         # Send the scan command
         data = DISCOVERY_REQUEST
         await dp2.send(data, bcast)
 
         # Wait on the scan response
-        task = asyncio.create_task(dp2.packets.get())
+        task = dp2.packet
         await asyncio.wait_for(task, DEFAULT_TIMEOUT)
         response = task.result()
 
         assert response == DISCOVERY_RESPONSE
-        serv.join(timeout=DEFAULT_TIMEOUT)
+        dp2.close()
+        await asyncio.wait_for(serv, DEFAULT_TIMEOUT)
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "addr,family",
-    [
-        (("127.0.0.1", 7000), socket.AF_INET),
-    ],
-)
-async def test_broadcast_timeout(addr, family):
+@_DISCOVERY_PORT_GROUP
+async def test_broadcast_timeout(socket_pool):
     """Create an async broadcast listener, test discovery responses."""
 
     # Run the listener portion now
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
 
-    bcast = (addr[0], 7000)
-    local_addr = (addr[0], 0)
+    bcast = _DISCOVERY_ADDR
 
     dp2 = FakeDiscoveryProtocol()
-    await loop.create_datagram_endpoint(
-        lambda: dp2,
-        local_addr=local_addr,
-    )
+    await loop.create_datagram_endpoint(lambda: dp2, sock=socket_pool.acquire())
 
     # Send the scan command
     await dp2.send(DISCOVERY_REQUEST, bcast)
 
     # Wait on the scan response
-    task = asyncio.create_task(dp2.packets.get())
+    task = dp2.packet
     with pytest.raises(asyncio.TimeoutError):
         await asyncio.wait_for(task, DEFAULT_TIMEOUT)
 
@@ -223,62 +261,146 @@ async def test_broadcast_timeout(addr, family):
         response = task.result()
         assert len(response) == 0
 
+    dp2.close()
+
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("addr,family", [(("127.0.0.1", 7000), socket.AF_INET)])
-async def test_datagram_connect(addr, family):
+async def test_datagram_connect():
     """Create a socket responder, an async connection, test send and recv."""
-    with Responder(family, addr[1], bcast=False) as sock:
-
-        def responder(s):
-            (d, addr) = s.recvfrom(2048)
-            p = json.dumps(DEFAULT_RESPONSE)
-            s.sendto(p.encode(), addr)
-
-        serv = Thread(target=responder, args=(sock,))
-        serv.start()
+    with Responder(socket.AF_INET, 0, bcast=False) as sock:
+        serv = _start_responder(sock, _DEFAULT_RESPONSE_BYTES)
 
         # Run the listener portion now
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         drained = asyncio.Event()
 
-        remote_addr = (addr[0], 7000)
+        remote_addr = _local_addr(sock)
         transport, protocol = await loop.create_datagram_endpoint(
             lambda: FakeDeviceProtocol(drained=drained), remote_addr=remote_addr
         )
 
         # Send the scan command
-        cipher = FakeCipher(b"1234567890123456")
+        cipher = _FAKE_CIPHER
         await protocol.send(DEFAULT_REQUEST, remote_addr, cipher)
 
         # Wait on the scan response
-        task = asyncio.create_task(protocol.packets.get())
+        task = protocol.packet
         await asyncio.wait_for(task, DEFAULT_TIMEOUT)
         response = task.result()
 
         assert response == DEFAULT_RESPONSE
 
-        sock.close()
-        serv.join(timeout=DEFAULT_TIMEOUT)
+        await asyncio.wait_for(serv, DEFAULT_TIMEOUT)
+
+
+@pytest.mark.asyncio
+async def test_transport_hub():
+    """Test devices sharing a hub socket only receive their own datagrams."""
+    with Responder(socket.AF_INET, 0, bcast=False) as sock:
+        serv = _start_responder(sock, _DEFAULT_RESPONSE_BYTES)
+
+        addr = _local_addr(sock)
+        hub = DeviceTransportHub(local_addr=(addr[0], 0))
+        device = FakeDeviceProtocol()
+        other = FakeDeviceProtocol()
+        await hub.attach(device, addr)
+        await hub.attach(other, (addr[0], addr[1] + 1))
+
+        await device.send(DEFAULT_REQUEST, cipher=_FAKE_CIPHER)
+
+        response = await asyncio.wait_for(device.packet, DEFAULT_TIMEOUT)
+        assert response == DEFAULT_RESPONSE
+        assert not other.packet.done()
+
+        assert device._transport is not None
+        device._transport.close()
+        assert addr not in hub.devices
+
+        hub.close()
+        await asyncio.wait_for(serv, DEFAULT_TIMEOUT)
+
+
+@pytest.mark.asyncio
+async def test_transport_hub_connection_lost():
+    """Test every attached device is told when the shared socket fails."""
+    hub = DeviceTransportHub(local_addr=("127.0.0.1", 0))
+    devices = [FakeDeviceProtocol(), FakeDeviceProtocol()]
+    await hub.attach(devices[0], ("127.0.0.1", 7101))
+    await hub.attach(devices[1], ("127.0.0.1", 7102))
+    transport = hub._transport
+    assert transport is not None
+
+    hub.connection_lost(RuntimeError("socket failed"))
+
+    assert all(device._transport is None for device in devices)
+    assert hub.devices == {}
+    transport.close()
+
+
+@pytest.mark.asyncio
+async def test_transport_hub_rejects_duplicate_address():
+    """Test a second device cannot take over an attached address."""
+    hub = DeviceTransportHub(local_addr=("127.0.0.1", 0))
+    device = FakeDeviceProtocol()
+    other = FakeDeviceProtocol()
+    addr = ("127.0.0.1", 7101)
+    await hub.attach(device, addr)
+
+    with pytest.raises(ValueError):
+        await hub.attach(other, addr)
+    assert hub.devices[addr] is device
+    assert other._transport is None
+
+    assert device._transport is not None
+    device._transport.close()
+    await hub.attach(other, addr)
+    assert hub.devices[addr] is other
+
+    hub.close()
+
+
+@pytest.mark.asyncio
+async def test_send_many():
+    """Test several packets are written to the transport in one call."""
+    protocol = DeviceProtocol2(timeout=DEFAULT_TIMEOUT)
+    protocol.device_cipher = _FAKE_CIPHER
+    protocol._transport = MagicMock()
+    device_info = DeviceInfo(*get_mock_info())
+
+    await protocol.send_many(
+        protocol.create_status_message(device_info, col) for col in ("a", "b")
+    )
+
+    assert protocol._transport.sendto.call_count == 2
+    sent = [json.loads(c.args[0]) for c in protocol._transport.sendto.call_args_list]
+    assert [p["pack"]["cols"] for p in sent] == [["a"], ["b"]]
 
 
 def test_bindok_handling():
     """Test the bindok response."""
     response = generate_response({"t": "bindok", "key": "fake-key"})
     protocol = DeviceProtocol2(timeout=DEFAULT_TIMEOUT)
-    protocol.device_cipher = FakeCipher(b"1234567890123456")
+    protocol.device_cipher = _FAKE_CIPHER
 
     with patch.object(DeviceProtocol2, "handle_device_bound") as mock:
         protocol.datagram_received(json.dumps(
-            response).encode(), ("0.0.0.0", 0))
+            response).encode(), _NULL_ADDR)
         assert mock.call_count == 1
         assert mock.call_args[0][0] == "fake-key"
 
 
-def test_create_bind_message():
+@pytest.fixture(name="protocol_and_info", scope="module")
+def protocol_and_info_fixture():
+    """A protocol and device info shared by the message building tests.
+
+    Building messages does not change either of them.
+    """
+    return DeviceProtocol2(), DeviceInfo(*get_mock_info())
+
+
+def test_create_bind_message(protocol_and_info):
     # Arrange
-    device_info = DeviceInfo(*get_mock_info())
-    protocol = DeviceProtocol2()
+    protocol, device_info = protocol_and_info
 
     # Act
     result = protocol.create_bind_message(device_info)
@@ -295,10 +417,9 @@ def test_create_bind_message():
     }
 
 
-def test_create_status_message():
+def test_create_status_message(protocol_and_info):
     # Arrange
-    device_info = DeviceInfo(*get_mock_info())
-    protocol = DeviceProtocol2()
+    protocol, device_info = protocol_and_info
 
     # Act
     result = protocol.create_status_message(device_info, "test")
@@ -319,10 +440,9 @@ def test_create_status_message():
     }
 
 
-def test_create_command_message():
+def test_create_command_message(protocol_and_info):
     # Arrange
-    device_info = DeviceInfo(*get_mock_info())
-    protocol = DeviceProtocol2()
+    protocol, device_info = protocol_and_info
 
     # Act
     result = protocol.create_command_message(device_info, **{"key": "value"})
@@ -362,63 +482,44 @@ class DeviceProtocol2Test(DeviceProtocol2):
         self.unknown = True
 
 
-def test_handle_state_update():
-    # Arrange
-    protocol = DeviceProtocol2Test()
-    state = {"key": "value"}
-
-    # Act
-    protocol.packet_received(
-        {"pack": {"t": "dat", "cols": list(
-            state.keys()), "dat": list(state.values())}},
-        ("0.0.0.0", 0),
-    )
-
-    # Assert
-    assert protocol.state == state
-    assert protocol.state == {"key": "value"}
-
-
-def test_handle_result_update():
-    # Arrange
-    protocol = DeviceProtocol2Test()
-    state = {"key": "value"}
-
-    # Act
-    protocol.packet_received(
-        {"pack": {"t": "res", "opt": list(
-            state.keys()), "val": list(state.values())}},
-        ("0.0.0.0", 0),
-    )
+@pytest.fixture(name="protocol2_session", scope="module")
+def protocol2_session_fixture():
+    """Build the handler test protocol once for the module."""
+    return DeviceProtocol2Test()
 
-    # Assert
-    assert protocol.state == state
-    assert protocol.state == {"key": "value"}
 
+@pytest.fixture(name="protocol2")
+def protocol2_fixture(protocol2_session):
+    """Handler test protocol, reset to its initial state."""
+    protocol2_session.state = {}
+    protocol2_session.key = None
+    protocol2_session.unknown = False
+    protocol2_session._ready.clear()
+    return protocol2_session
 
-def test_handle_device_bound():
-    # Arrange
-    protocol = DeviceProtocol2Test()
 
+@pytest.mark.parametrize(
+    "pack,expected",
+    [
+        ({"t": "dat", "cols": ["key"], "dat": ["value"]}, {"state": {"key": "value"}}),
+        ({"t": "res", "opt": ["key"], "val": ["value"]}, {"state": {"key": "value"}}),
+        ({"t": "bindok", "key": "fake-key"}, {"key": "fake-key"}),
+        ({"t": "unknown"}, {"unknown": True}),
+    ],
+    ids=["state", "result", "bound", "unknown"],
+)
+def test_protocol2_handlers(protocol2, pack, expected):
     # Act
-    protocol.packet_received(
-        {"pack": {"t": "bindok", "key": "fake-key"}}, ("0.0.0.0", 0)
-    )
+    protocol2.packet_received({"pack": pack}, _NULL_ADDR)
 
     # Assert
-    assert protocol._ready.is_set()
-    assert protocol.key == "fake-key"
+    for attr, value in expected.items():
+        assert getattr(protocol2, attr) == value
+    assert protocol2._ready.is_set() is (pack["t"] == "bindok")
 
 
-def test_handle_unknown_packet():
-    # Arrange
-    protocol = DeviceProtocol2Test()
-
-    # Act
-    protocol.packet_received({"pack": {"t": "unknown"}}, ("0.0.0.0", 0))
-
-    # Assert
-    assert protocol.unknown is True
+# Fields every generated payload shares
+_PAYLOAD_HEADER = {"cid": "app", "uid": 0}
 
 
 @pytest.mark.parametrize(
@@ -430,20 +531,18 @@ def test_handle_unknown_packet():
         (0, Commands.CMD, {"opt": ["key"], "p": ["value"]}),
     ],
 )
-def test_generate_payload(use_default_key, command, data):
+def test_generate_payload(protocol_and_info, use_default_key, command, data):
     # Arrange
-    device_info = DeviceInfo(*get_mock_info())
-    protocol = DeviceProtocol2()
+    protocol, device_info = protocol_and_info
 
     # Act
     result = protocol._generate_payload(command, device_info, data)
 
     # Assert
     expected = {
-        "cid": "app",
+        **_PAYLOAD_HEADER,
         "i": use_default_key,  # Device key encryption
         "t": Commands.PACK.value if data is not None else command.value,
-        "uid": 0,
         "tcid": device_info.mac,
     }
     if data:
@@ -474,11 +573,11 @@ async def test_add_and_remove_handler(event_name, data):
     protocol.add_handler(event_name, callback)
 
     # Assert that the handler was added
-    assert event_name in protocol._handlers
-    assert callback in protocol._handlers[event_name]
+    assert event_name.value in protocol._handlers
+    assert callback in protocol._handlers[event_name.value]
 
     # Trigger the event
-    protocol.packet_received(event_data, ("0.0.0.0", 0))
+    protocol.packet_received(event_data, _NULL_ADDR)
 
     # Check that the callback was called
     callback.assert_called_once()
@@ -487,13 +586,13 @@ async def test_add_and_remove_handler(event_name, data):
     protocol.remove_handler(event_name, callback)
 
     # Assert that the handler was removed
-    assert callback not in protocol._handlers[event_name]
+    assert callback not in protocol._handlers[event_name.value]
 
     # Reset the callback
     callback.reset_mock()
 
     # Trigger the event again
-    protocol.packet_received(event_data, ("0.0.0.0", 0))
+    protocol.packet_received(event_data, _NULL_ADDR)
 
     # Check that the callback was not called this time
     callback.assert_not_called()
@@ -505,7 +604,7 @@ def test_packet_received_not_implemented():
 
     # Act
     with pytest.raises(NotImplementedError):
-        protocol.packet_received({}, ("0.0.0.0", 0))
+        protocol.packet_received({}, _NULL_ADDR)
 
 
 def test_packet_received_invalid_data():
@@ -513,19 +612,19 @@ def test_packet_received_invalid_data():
     protocol = DeviceProtocol2()
 
     # Act
-    protocol.packet_received(None, ("0.0.0.0", 0))
-    protocol.packet_received({}, ("0.0.0.0", 0))
-    protocol.packet_received({"pack"}, ("0.0.0.0", 0))
+    protocol.packet_received(None, _NULL_ADDR)
+    protocol.packet_received({}, _NULL_ADDR)
+    protocol.packet_received({"pack"}, _NULL_ADDR)
 
     with patch.object(protocol, "handle_unknown_packet") as mock:
-        protocol.packet_received({"pack": {"t": "unknown"}}, ("0.0.0.0", 0))
+        protocol.packet_received({"pack": {"t": "unknown"}}, _NULL_ADDR)
         mock.assert_called_once()
 
 
 def test_set_get_cipher():
     # Arrange
     protocol = DeviceProtocolBase2()
-    cipher = FakeCipher(b"1234567890123456")
+    cipher = _FAKE_CIPHER
 
     # Act
     protocol.device_cipher = cipher
@@ -558,9 +657,6 @@ def test_add_invalid_handler():
     with pytest.raises(ValueError):
         protocol.add_handler(Response("invalid"), callback)
 
-    with pytest.raises(ValueError):
-        protocol.add_handler(Response("invalid"), callback)
-
 
 def test_device_key_get_set():
     # Arrange
@@ -574,6 +670,14 @@ def test_device_key_get_set():
     assert protocol.device_key == key
 
 
+@pytest.fixture(name="drained_protocol", scope="module")
+def drained_protocol_fixture():
+    """Protocol with a cipher, shared by the drained event cases."""
+    protocol = DeviceProtocol2()
+    protocol.device_cipher = _FAKE_CIPHER
+    return protocol
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "response",
@@ -619,20 +723,17 @@ def test_device_key_get_set():
         }
     ]
 )
-async def test_drained_event_set_after_response(response):
+async def test_drained_event_set_after_response(drained_protocol, response):
     """Test that the _drained event is set after receiving a response.
 
     Tests various response types and error cases to ensure _drained is always set.
     """
     # Arrange
-    protocol = DeviceProtocol2()
-    protocol.device_cipher = FakeCipher(b"1234567890123456")
-
-    # Clear the drained event (it's set in __init__)
-    protocol._drained.clear()
+    # Clear the drained event (it's set in __init__ and by the previous case)
+    drained_protocol._drained.clear()
 
     # Act
-    protocol.packet_received(response, ("0.0.0.0", 0))
+    drained_protocol.packet_received(response, _NULL_ADDR)
 
     # Assert
-    assert protocol._drained.is_set()
+    assert drained_protocol._drained.is_set()